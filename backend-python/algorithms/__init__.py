@@ -1,11 +1,12 @@
 """Algorithms package - organized by category"""
+import importlib
 
 # Import category modules
 from .sorting import OPERATIONS as SORTING_OPS, CODE_SAMPLES as SORTING_SAMPLES, execute as sorting_execute
 from .searching import OPERATIONS as SEARCHING_OPS, CODE_SAMPLES as SEARCHING_SAMPLES, execute as searching_execute
-from .trees import OPERATIONS as TREES_OPS, CODE_SAMPLES as TREES_SAMPLES, execute as trees_execute
+from .trees import OPERATIONS as TREES_OPS, execute as trees_execute
 from .linkedlist import OPERATIONS as LINKEDLIST_OPS, CODE_SAMPLES as LINKEDLIST_SAMPLES, execute as linkedlist_execute
-from .stack import OPERATIONS as STACK_OPS, CODE_SAMPLES as STACK_SAMPLES, execute as stack_execute
+from .stack import OPERATIONS as STACK_OPS, execute as stack_execute
 from .queue import OPERATIONS as QUEUE_OPS, CODE_SAMPLES as QUEUE_SAMPLES, execute as queue_execute
 
 # Module registry
@@ -28,7 +29,7 @@ MODULES = {
         "name": "Tree Algorithms",
         "icon": "🌲",
         "operations": TREES_OPS,
-        "code": TREES_SAMPLES,
+        "code": None,  # read from code_samples/ on first get_module
         "execute": trees_execute,
     },
     "linkedlist": {
@@ -42,7 +43,7 @@ MODULES = {
         "name": "Stack",
         "icon": "📚",
         "operations": STACK_OPS,
-        "code": STACK_SAMPLES,
+        "code": None,  # submodules imported on first get_module
         "execute": stack_execute,
     },
     "queue": {
@@ -56,12 +57,19 @@ MODULES = {
 
 def get_module(module_name):
     """Get module configuration"""
-    return MODULES.get(module_name)
+    module = MODULES.get(module_name)
+    # Categories whose samples load lazily get them on first request only,
+    # so importing the package (server start, /api/execute) never reads them
+    if module is not None and module["code"] is None:
+        module["code"] = importlib.import_module(f".{module_name}", __name__).CODE_SAMPLES
+    return module
 
 def execute_module(module_name, operation, params):
-    """Execute algorithm"""
+    """Execute algorithm and return its frames as a list"""
     module = MODULES.get(module_name)
     if not module:
         raise ValueError(f"Module not found: {module_name}")
     
-    return module["execute"](operation, params)
+    # Executors may yield frames lazily; materialize here so errors raised
+    # mid-run surface to the caller instead of during response encoding
+    return list(module["execute"](operation, params))
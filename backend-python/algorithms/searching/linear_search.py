@@ -14,6 +14,10 @@ def create_frame(step_id, description, data, highlights=None, variables=None):
     }
     return frame
 
+def range_highlight(start, end):
+    """Compact highlight for indices start..end-1, expanded by the frontend"""
+    return {"range": [start, end]}
+
 CODE_SAMPLE = """#include <bits/stdc++.h>
 using namespace std;
 
@@ -50,12 +54,14 @@ int main() {
 """
 
 def execute(params):
-    """Execute linear search with 15-20 comprehensive frames"""
-    frames = []
+    """Execute linear search, yielding 15-20 comprehensive frames"""
     frame_id = 0
     
     arr = params.get('array', [64, 25, 12, 22, 11, 90, 88])
     target = params.get('target', 22)
+    # Loop-invariant strings are built once, not per scanned element
+    target_str = str(target)
+    n = len(arr)
     
     # FRAME 0: Introduction
     frame = create_frame(
@@ -63,9 +69,9 @@ def execute(params):
         "🔍 Linear Search: The simplest search algorithm - check each element sequentially until found",
         arr,
         [],
-        [{"name": "target", "value": str(target), "type": "int"}]
+        [{"name": "target", "value": target_str, "type": "int"}]
     )
-    frames.append(frame)
+    yield frame
     frame_id += 1
     
     # FRAME 1: Goal and Strategy
@@ -75,12 +81,12 @@ def execute(params):
         arr,
         [],
         [
-            {"name": "target", "value": str(target), "type": "int"},
+            {"name": "target", "value": target_str, "type": "int"},
             {"name": "array_size", "value": str(len(arr)), "type": "int"},
             {"name": "worst_case", "value": f"{len(arr)} comparisons", "type": "string"}
         ]
     )
-    frames.append(frame)
+    yield frame
     frame_id += 1
     
     # FRAME 2: Algorithm explanation
@@ -91,7 +97,7 @@ def execute(params):
         [0],  # Highlight starting position
         [{"name": "current_index", "value": "0", "type": "int"}]
     )
-    frames.append(frame)
+    yield frame
     frame_id += 1
     
     # Search process
@@ -99,8 +105,9 @@ def execute(params):
     found_index = -1
     comparisons = 0
     
-    for i in range(len(arr)):
+    for i in range(n):
         comparisons += 1
+        i_str = str(i)
         
         # FRAME: Checking current element
         frame = create_frame(
@@ -109,13 +116,13 @@ def execute(params):
             arr,
             [i],
             [
-                {"name": "current_index", "value": str(i), "type": "int"},
+                {"name": "current_index", "value": i_str, "type": "int"},
                 {"name": "current_value", "value": str(arr[i]), "type": "int"},
-                {"name": "target", "value": str(target), "type": "int"},
+                {"name": "target", "value": target_str, "type": "int"},
                 {"name": "comparisons", "value": str(comparisons), "type": "int"}
             ]
         )
-        frames.append(frame)
+        yield frame
         frame_id += 1
         
         # FRAME: Comparison result
@@ -132,7 +139,7 @@ def execute(params):
                     {"name": "status", "value": "FOUND", "type": "string"}
                 ]
             )
-            frames.append(frame)
+            yield frame
             frame_id += 1
             found = True
             found_index = i
@@ -143,14 +150,14 @@ def execute(params):
                 frame_id,
                 f"❌ No match: {arr[i]} ≠ {target}. Continue to next element...",
                 arr,
-                list(range(i + 1)),  # Show all checked elements
+                range_highlight(0, i + 1),  # Show all checked elements
                 [
-                    {"name": "current_index", "value": str(i), "type": "int"},
+                    {"name": "current_index", "value": i_str, "type": "int"},
                     {"name": "checked_so_far", "value": str(i + 1), "type": "int"},
-                    {"name": "remaining", "value": str(len(arr) - i - 1), "type": "int"}
+                    {"name": "remaining", "value": str(n - i - 1), "type": "int"}
                 ]
             )
-            frames.append(frame)
+            yield frame
             frame_id += 1
     
     # Final result frames
@@ -167,7 +174,7 @@ def execute(params):
                 {"name": "efficiency", "value": f"{comparisons}/{len(arr)} elements checked", "type": "string"}
             ]
         )
-        frames.append(frame)
+        yield frame
         frame_id += 1
         
         # FRAME: Performance analysis
@@ -181,21 +188,21 @@ def execute(params):
                 {"name": "space_complexity", "value": "O(1)", "type": "string"}
             ]
         )
-        frames.append(frame)
+        yield frame
     else:
         # FRAME: Not found
         frame = create_frame(
             frame_id,
             f"❌ Search Complete: {target} NOT FOUND in array after checking all {comparisons} elements",
             arr,
-            list(range(len(arr))),  # Highlight all checked
+            range_highlight(0, len(arr)),  # Highlight all checked
             [
                 {"name": "result", "value": "-1", "type": "int"},
                 {"name": "comparisons", "value": str(comparisons), "type": "int"},
                 {"name": "status", "value": "NOT FOUND", "type": "string"}
             ]
         )
-        frames.append(frame)
+        yield frame
         frame_id += 1
         
         # FRAME: Performance for failed search
@@ -209,7 +216,7 @@ def execute(params):
                 {"name": "comparisons", "value": str(comparisons), "type": "int"}
             ]
         )
-        frames.append(frame)
+        yield frame
     
     # FRAME: Use cases
     frame_id += 1
@@ -223,6 +230,4 @@ def execute(params):
             {"name": "cons", "value": "Slow for large arrays O(n)", "type": "string"}
         ]
     )
-    frames.append(frame)
-    
-    return frames
+    yield frame
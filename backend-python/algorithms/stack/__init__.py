@@ -1,40 +1,59 @@
-"""Stack algorithms package"""
-from .push_stack import execute as push_execute, CODE_SAMPLE as push_sample
-from .pop_stack import execute as pop_execute, CODE_SAMPLE as pop_sample
-from .infix_to_postfix import execute as infix_postfix_execute, CODE_SAMPLE as infix_postfix_sample
-from .postfix_eval import execute as postfix_eval_execute, CODE_SAMPLE as postfix_eval_sample
-from .prefix_postfix import execute as prefix_postfix_execute, CODE_SAMPLE as prefix_postfix_sample
-from .balanced_parens import execute as balanced_execute, CODE_SAMPLE as balanced_sample
-
-OPERATIONS = [
-    {"id": "push", "name": "Stack Push"},
-    {"id": "pop", "name": "Stack Pop"},
-    {"id": "infix_postfix", "name": "Infix → Postfix Conversion"},
-    {"id": "postfix_eval", "name": "Postfix Evaluation"},
-    {"id": "prefix_postfix", "name": "Prefix/Postfix Conversion"},
-    {"id": "balanced", "name": "Balanced Parentheses"},
-]
-
-CODE_SAMPLES = {
-    "push": push_sample,
-    "pop": pop_sample,
-    "infix_postfix": infix_postfix_sample,
-    "postfix_eval": postfix_eval_sample,
-    "prefix_postfix": prefix_postfix_sample,
-    "balanced": balanced_sample,
+"""Stack algorithms package
+
+Submodules are imported on first use (PEP 562 module ``__getattr__``), so a
+request for one operation doesn't pay for parsing the other five.
+"""
+import importlib
+
+# Single source of truth: operation id -> (display name, submodule)
+_REGISTRY = {
+    "push": ("Stack Push", ".push_stack"),
+    "pop": ("Stack Pop", ".pop_stack"),
+    "infix_postfix": ("Infix → Postfix Conversion", ".infix_to_postfix"),
+    "postfix_eval": ("Postfix Evaluation", ".postfix_eval"),
+    "prefix_postfix": ("Prefix/Postfix Conversion", ".prefix_postfix"),
+    "balanced": ("Balanced Parentheses", ".balanced_parens"),
 }
 
+OPERATIONS = [{"id": op_id, "name": name} for op_id, (name, _) in _REGISTRY.items()]
+
+# Legacy package-level names, resolved lazily: name -> (submodule, attribute)
+_LAZY = {}
+for _op_id, (_, _module) in _REGISTRY.items():
+    _LAZY[f"{_op_id}_execute"] = (_module, "execute")
+    _LAZY[f"{_op_id}_sample"] = (_module, "CODE_SAMPLE")
+del _op_id, _module
+_LAZY["is_balanced"] = (".balanced_parens", "is_balanced")
+_LAZY["evaluate_postfix"] = (".postfix_eval", "evaluate")
+_LAZY["prefix_to_postfix"] = (".prefix_postfix", "convert")
+
+# Filled on first hit per operation
+_DISPATCH = {}
+
+
+def _load(module):
+    return importlib.import_module(module, __package__)
+
+
+def __getattr__(name):
+    if name == "CODE_SAMPLES":
+        value = {op_id: _load(module).CODE_SAMPLE for op_id, (_, module) in _REGISTRY.items()}
+    else:
+        try:
+            module, attr = _LAZY[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        value = getattr(_load(module), attr)
+    globals()[name] = value
+    return value
+
+
 def execute(operation, params):
-    if operation == "push":
-        return push_execute(params)
-    elif operation == "pop":
-        return pop_execute(params)
-    elif operation == "infix_postfix":
-        return infix_postfix_execute(params)
-    elif operation == "postfix_eval":
-        return postfix_eval_execute(params)
-    elif operation == "prefix_postfix":
-        return prefix_postfix_execute(params)
-    elif operation == "balanced":
-        return balanced_execute(params)
-    raise ValueError(f"Unknown operation: {operation}")
+    executor = _DISPATCH.get(operation)
+    if executor is None:
+        try:
+            module = _REGISTRY[operation][1]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation}") from None
+        executor = _DISPATCH[operation] = _load(module).execute
+    return executor(params)
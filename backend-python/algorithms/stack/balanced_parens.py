@@ -30,114 +30,134 @@ bool isBalanced(string expr) {
 }
 """
 
+# Bracket classes: one str.translate() call tags the whole expression in C.
+# The two class codes are remapped on input so they can't be mistaken.
+OPENING, CLOSING, OTHER = range(3)
+BRACKET_TRANS = str.maketrans({
+    **{c: chr(OPENING) for c in '([{'},
+    **{c: chr(CLOSING) for c in ')]}'},
+    chr(OPENING): chr(OTHER),
+    chr(CLOSING): chr(OTHER),
+})
+
+# (open, close) pairs that match - one hash lookup per check
+MATCH_PAIRS = frozenset({('(', ')'), ('[', ']'), ('{', '}')})
+
+def is_balanced(expression):
+    """Boolean-only fast path for callers that don't need frames"""
+    stack = []
+    for char, code in zip(expression, expression.translate(BRACKET_TRANS)):
+        cls = ord(code)
+        if cls == OPENING:
+            stack.append(char)
+        elif cls == CLOSING:
+            if not stack or (stack.pop(), char) not in MATCH_PAIRS:
+                return False
+    return not stack
+
 def execute(params):
-    frames = []
     expression = params.get('expression', "{[()]}")
     
-    def matches(open_b, close_b):
-        pairs = {'(': ')', '[': ']', '{': '}'}
-        return pairs.get(open_b) == close_b
-    
     # Frame 0: Intro
-    frames.append({
+    yield {
         "description": f"🔍 Balanced Parentheses: Check '{expression}'",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
     # Frame 1: Strategy
-    frames.append({
+    yield {
         "description": "📚 Strategy: Push opening, pop & match closing",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
     # Frame 2: Initial
     stack = []
-    frames.append({
+    yield {
         "description": f"📋 Expression: '{expression}' | Stack: []",
         "data": {"values": stack.copy(), "highlights": {}}
-    })
+    }
     
     balanced = True
     
-    for i, char in enumerate(expression):
-        frames.append({
+    classes = expression.translate(BRACKET_TRANS)
+    for i, (char, code) in enumerate(zip(expression, classes)):
+        cls = ord(code)
+        yield {
             "description": f"📍 Scanning: '{char}' at position {i}",
             "data": {"values": stack.copy(), "highlights": {}}
-        })
+        }
         
-        if char in '([{':
+        if cls == OPENING:
             stack.append(char)
-            frames.append({
+            yield {
                 "description": f"📌 Opening '{char}' → Push to stack",
                 "data": {
                     "values": stack.copy(),
                     "highlights": {"indices": [len(stack)-1], "colors": ["#2ecc71"], "labels": ["PUSHED"]}
                 }
-            })
+            }
         
-        elif char in ')]}':
+        elif cls == CLOSING:
             if not stack:
-                frames.append({
+                yield {
                     "description": f"❌ Closing '{char}' but stack EMPTY → UNBALANCED!",
                     "data": {"values": [], "highlights": {}}
-                })
+                }
                 balanced = False
                 break
             
             top = stack[-1]
-            frames.append({
+            yield {
                 "description": f"🔍 Check: Does '{top}' match '{char}'?",
                 "data": {
                     "values": stack.copy(),
                     "highlights": {"indices": [len(stack)-1], "colors": ["#f39c12"], "labels": ["CHECK"]}
                 }
-            })
+            }
             
-            if matches(top, char):
+            if (top, char) in MATCH_PAIRS:
                 stack.pop()
-                frames.append({
+                yield {
                     "description": f"✅ MATCH! '{top}' matches '{char}' → Pop",
                     "data": {"values": stack.copy(), "highlights": {}}
-                })
+                }
             else:
-                frames.append({
+                yield {
                     "description": f"❌ NO MATCH! '{top}' ≠ '{char}' → UNBALANCED!",
                     "data": {"values": stack.copy(), "highlights": {}}
-                })
+                }
                 balanced = False
                 break
     
     # Final check
     if balanced:
         if not stack:
-            frames.append({
+            yield {
                 "description": "✅ Stack EMPTY → All matched → BALANCED!",
                 "data": {"values": [], "highlights": {}}
-            })
+            }
             
-            frames.append({
+            yield {
                 "description": f"📊 Result: '{expression}' is BALANCED ✓",
                 "data": {"values": [], "highlights": {}}
-            })
+            }
         else:
-            frames.append({
+            yield {
                 "description": f"❌ Stack NOT EMPTY (has {stack}) → UNBALANCED!",
                 "data": {"values": stack.copy(), "highlights": {}}
-            })
+            }
             
-            frames.append({
+            yield {
                 "description": f"📊 Result: '{expression}' is UNBALANCED ✗",
                 "data": {"values": stack.copy(), "highlights": {}}
-            })
+            }
     else:
-        frames.append({
+        yield {
             "description": f"📊 Result: '{expression}' is UNBALANCED ✗",
             "data": {"values": stack.copy(), "highlights": {}}
-        })
+        }
     
-    frames.append({
+    yield {
         "description": "⏱️ Time: O(n) | Space: O(n)",
         "data": {"values": stack.copy() if stack else [], "highlights": {}}
-    })
-    
-    return frames
+    }
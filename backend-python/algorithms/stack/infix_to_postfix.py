@@ -1,4 +1,5 @@
 """Infix to Postfix Conversion - Production Grade with Logical Frames"""
+import string
 
 CODE_SAMPLE = """#include <iostream>
 #include <stack>
@@ -44,8 +45,19 @@ string infixToPostfix(string infix) {
 }
 """
 
+# Character classes for the scan loop. CLASS_TRANS maps every ASCII char
+# to chr(class) so one str.translate() call classifies the whole input in C;
+# non-ASCII chars pass through unchanged (code > OTHER).
+OPERAND, LPAREN, RPAREN, OPERATOR, OTHER = range(5)
+CLASS_TRANS = str.maketrans({
+    **{chr(b): chr(OTHER) for b in range(128)},
+    **{c: chr(OPERAND) for c in string.ascii_letters + string.digits},
+    '(': chr(LPAREN),
+    ')': chr(RPAREN),
+    **{c: chr(OPERATOR) for c in '+-*/'},
+})
+
 def execute(params):
-    frames = []
     infix = params.get('expression', "a+b*c")
     
     def precedence(op):
@@ -54,112 +66,115 @@ def execute(params):
         return 0
     
     # Frame 0: Intro
-    frames.append({
+    yield {
         "description": f"🔄 Infix → Postfix: Convert '{infix}'",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
     # Frame 1: Initial state
     stack = []
-    output = ""
-    frames.append({
+    output_parts = []  # joined only when a frame shows the output
+    yield {
         "description": f"📋 Input: '{infix}' | Stack: [] | Output: \"\"",
         "data": {"values": stack.copy(), "highlights": {}}
-    })
+    }
     
     # Process each character
-    for i, char in enumerate(infix):
+    classes = infix.translate(CLASS_TRANS)
+    for i, (char, code) in enumerate(zip(infix, classes)):
+        cls = ord(code)
+        if cls > OTHER:  # Non-ASCII keeps the old isalnum() rule
+            cls = OPERAND if char.isalnum() else OTHER
         # Show scanning
-        frames.append({
+        yield {
             "description": f"📍 Scanning character '{char}' at position {i}",
             "data": {"values": stack.copy(), "highlights": {}}
-        })
+        }
         
-        if char.isalnum():  # Operand
-            output += char
-            frames.append({
-                "description": f"✓ '{char}' is operand → Add to output: \"{output}\"",
+        if cls == OPERAND:
+            output_parts.append(char)
+            yield {
+                "description": f"✓ '{char}' is operand → Add to output: \"{''.join(output_parts)}\"",
                 "data": {"values": stack.copy(), "highlights": {}}
-            })
+            }
         
-        elif char == '(':
+        elif cls == LPAREN:
             stack.append(char)
-            frames.append({
+            yield {
                 "description": f"📌 '(' pushed to stack",
                 "data": {
                     "values": stack.copy(),
                     "highlights": {"indices": [len(stack)-1], "colors": ["#3498db"], "labels": ["PUSHED"]}
                 }
-            })
+            }
         
-        elif char == ')':
-            frames.append({
+        elif cls == RPAREN:
+            yield {
                 "description": f"🔍 ')' found → Pop until '('",
                 "data": {"values": stack.copy(), "highlights": {}}
-            })
+            }
             
             while stack and stack[-1] != '(':
                 op = stack.pop()
-                output += op
-                frames.append({
-                    "description": f"⬆️ Pop '{op}' to output: \"{output}\"",
+                output_parts.append(op)
+                yield {
+                    "description": f"⬆️ Pop '{op}' to output: \"{''.join(output_parts)}\"",
                     "data": {"values": stack.copy(), "highlights": {}}
-                })
+                }
             
             if stack and stack[-1] == '(':
                 stack.pop()
-                frames.append({
+                yield {
                     "description": f"🗑️ Remove matching '(' from stack",
                     "data": {"values": stack.copy(), "highlights": {}}
-                })
+                }
         
-        elif char in '+-*/':  # Operator
+        elif cls == OPERATOR:
             # Pop higher/equal precedence
             while stack and stack[-1] != '(' and precedence(stack[-1]) >= precedence(char):
                 op = stack.pop()
-                output += op
-                frames.append({
-                    "description": f"⬆️ '{op}' has ≥ precedence → Pop to output: \"{output}\"",
+                output_parts.append(op)
+                yield {
+                    "description": f"⬆️ '{op}' has ≥ precedence → Pop to output: \"{''.join(output_parts)}\"",
                     "data": {"values": stack.copy(), "highlights": {}}
-                })
+                }
             
             stack.append(char)
-            frames.append({
+            yield {
                 "description": f"📌 Push '{char}' to stack",
                 "data": {
                     "values": stack.copy(),
                     "highlights": {"indices": [len(stack)-1], "colors": ["#2ecc71"], "labels": ["PUSHED"]}
                 }
-            })
+            }
     
     # Pop remaining
-    frames.append({
+    yield {
         "description": f"🏁 End of input → Pop remaining operators",
         "data": {"values": stack.copy(), "highlights": {}}
-    })
+    }
     
     while stack:
         op = stack.pop()
-        output += op
-        frames.append({
-            "description": f"⬆️ Pop '{op}' to output: \"{output}\"",
+        output_parts.append(op)
+        yield {
+            "description": f"⬆️ Pop '{op}' to output: \"{''.join(output_parts)}\"",
             "data": {"values": stack.copy(), "highlights": {}}
-        })
+        }
     
     # Final
-    frames.append({
+    output = ''.join(output_parts)
+    yield {
         "description": f"✅ COMPLETE! Postfix: \"{output}\"",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
-    frames.append({
+    yield {
         "description": f"📊 {infix} (infix) = {output} (postfix)",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
-    frames.append({
+    yield {
         "description": "⏱️ Time: O(n) | Space: O(n)",
         "data": {"values": [], "highlights": {}}
-    })
-    
-    return frames
+    }
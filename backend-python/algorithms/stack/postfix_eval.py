@@ -1,4 +1,7 @@
 """Postfix Evaluation - Production Grade with Logical Frames"""
+import operator
+import string
+from functools import lru_cache
 
 CODE_SAMPLE = """#include <iostream>
 #include <stack>
@@ -28,110 +31,170 @@ int evaluatePostfix(string postfix) {
 }
 """
 
+def safe_floordiv(a, b):
+    """Integer division; division by zero yields 0 like the visualizer always did"""
+    return a // b if b != 0 else 0
+
+OP_TABLE = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': safe_floordiv,
+}
+
+# Character classes for the scan loops, same scheme as infix_to_postfix:
+# one str.translate() call classifies the whole input in C; non-ASCII chars
+# pass through unchanged (code > OTHER).
+OPERAND, OPERATOR, OTHER = range(3)
+CLASS_TRANS = str.maketrans({
+    **{chr(b): chr(OTHER) for b in range(128)},
+    **{c: chr(OPERAND) for c in string.digits},
+    **{c: chr(OPERATOR) for c in OP_TABLE},
+})
+
+# Frames depend only on the expression, so repeat runs (UI replay/stepping)
+# are served from cache. Cached frames are shared - callers must not mutate them.
+# A cached entry grows with the square of the expression length, so only
+# expressions up to CACHE_MAX_LENGTH are cached; longer ones are rebuilt.
+CACHE_SIZE = 256
+CACHE_MAX_LENGTH = 200
+
 def execute(params):
-    frames = []
     postfix = params.get('expression', "23*5+")
-    
+    if len(postfix) > CACHE_MAX_LENGTH:
+        return tuple(generate_frames(postfix))
+    return cached_frames(postfix)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_frames(postfix):
+    """All evaluation frames for one expression; reset with cached_frames.cache_clear()"""
+    return tuple(generate_frames(postfix))
+
+def evaluate(postfix):
+    """Frame-free fast path: the value execute() reports, or None if invalid"""
+    if len(postfix) > CACHE_MAX_LENGTH:
+        return _evaluate(postfix)
+    return _cached_evaluate(postfix)
+
+def _evaluate(postfix):
+    stack = []
+    for char, code in zip(postfix, postfix.translate(CLASS_TRANS)):
+        cls = ord(code)
+        if cls > OTHER:  # Non-ASCII keeps the old isdigit() rule
+            cls = OPERAND if char.isdigit() else OTHER
+        
+        if cls == OPERAND:
+            stack.append(int(char))
+        elif cls == OPERATOR and len(stack) >= 2:
+            b = stack.pop()
+            a = stack.pop()
+            stack.append(OP_TABLE[char](a, b))
+    return stack[0] if stack else None
+
+_cached_evaluate = lru_cache(maxsize=CACHE_SIZE)(_evaluate)
+
+def generate_frames(postfix):
     # Frame 0: Intro
-    frames.append({
+    yield {
         "description": f"📊 Postfix Evaluation: '{postfix}'",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
     # Frame 1: Initial
     stack = []
-    frames.append({
+    snap = ()  # immutable snapshot, refreshed only when the stack changes
+    yield {
         "description": f"📋 Expression: '{postfix}' | Stack: []",
-        "data": {"values": stack.copy(), "highlights": {}}
-    })
+        "data": {"values": snap, "highlights": {}}
+    }
     
-    for i, char in enumerate(postfix):
+    classes = postfix.translate(CLASS_TRANS)
+    for i, (char, code) in enumerate(zip(postfix, classes)):
+        cls = ord(code)
+        if cls > OTHER:  # Non-ASCII keeps the old isdigit() rule
+            cls = OPERAND if char.isdigit() else OTHER
+        
         # Scan
-        frames.append({
+        yield {
             "description": f"📍 Scanning: '{char}' at position {i}",
-            "data": {"values": stack.copy(), "highlights": {}}
-        })
+            "data": {"values": snap, "highlights": {}}
+        }
         
-        if char.isdigit():
+        if cls == OPERAND:
             val = int(char)
             stack.append(val)
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"🔢 '{char}' is operand → Push {val}",
                 "data": {
-                    "values": stack.copy(),
+                    "values": snap,
                     "highlights": {"indices": [len(stack)-1], "colors": ["#2ecc71"], "labels": ["PUSHED"]}
                 }
-            })
+            }
         
-        elif char in '+-*/':
+        elif cls == OPERATOR:
             if len(stack) < 2:
-                frames.append({
+                yield {
                     "description": "❌ Error: Need 2 operands!",
-                    "data": {"values": stack.copy(), "highlights": {}}
-                })
+                    "data": {"values": snap, "highlights": {}}
+                }
                 continue
             
             # Pop operands
             b = stack.pop()
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"⬆️ Pop operand: {b}",
-                "data": {"values": stack.copy(), "highlights": {}}
-            })
+                "data": {"values": snap, "highlights": {}}
+            }
             
             a = stack.pop()
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"⬆️ Pop operand: {a}",
-                "data": {"values": stack.copy(), "highlights": {}}
-            })
+                "data": {"values": snap, "highlights": {}}
+            }
             
             # Calculate
-            if char == '+':
-                result = a + b
-            elif char == '-':
-                result = a - b
-            elif char == '*':
-                result = a * b
-            elif char == '/':
-                result = a // b if b != 0 else 0
+            result = OP_TABLE[char](a, b)
             
-            frames.append({
+            yield {
                 "description": f"🧮 Calculate: {a} {char} {b} = {result}",
-                "data": {"values": stack.copy(), "highlights": {}}
-            })
+                "data": {"values": snap, "highlights": {}}
+            }
             
             stack.append(result)
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"📌 Push result: {result}",
                 "data": {
-                    "values": stack.copy(),
+                    "values": snap,
                     "highlights": {"indices": [len(stack)-1], "colors": ["#3498db"], "labels": ["RESULT"]}
                 }
-            })
+            }
     
     # Final
     if stack:
         result = stack[0]
-        frames.append({
+        yield {
             "description": f"✅ COMPLETE! Final result: {result}",
             "data": {
-                "values": stack.copy(),
+                "values": snap,
                 "highlights": {"indices": [0], "colors": ["#2ecc71"], "labels": ["ANSWER"]}
             }
-        })
+        }
         
-        frames.append({
+        yield {
             "description": f"📊 '{postfix}' = {result}",
             "data": {"values": [result], "highlights": {}}
-        })
+        }
     else:
-        frames.append({
+        yield {
             "description": "❌ Error: Invalid expression",
             "data": {"values": [], "highlights": {}}
-        })
+        }
     
-    frames.append({
+    yield {
         "description": "⏱️ Time: O(n) | Space: O(n)",
-        "data": {"values": stack.copy(), "highlights": {}}
-    })
-    
-    return frames
+        "data": {"values": snap, "highlights": {}}
+    }
@@ -1,4 +1,6 @@
 """Prefix to Postfix Conversion - Production Grade with Logical Frames"""
+import string
+from functools import lru_cache
 
 CODE_SAMPLE = """#include <iostream>
 #include <stack>
@@ -27,109 +29,178 @@ string prefixToPostfix(string prefix) {
 }
 """
 
+# Character classes for the scan loops, same scheme as infix_to_postfix:
+# one str.translate() call classifies the whole input in C; non-ASCII chars
+# pass through unchanged (code > OTHER).
+OPERAND, OPERATOR, OTHER = range(3)
+CLASS_TRANS = str.maketrans({
+    **{chr(b): chr(OTHER) for b in range(128)},
+    **{c: chr(OPERAND) for c in string.ascii_letters + string.digits},
+    **{c: chr(OPERATOR) for c in '+-*/'},
+})
+
+# Frames depend only on the expression, so repeat runs (UI replay/stepping)
+# are served from cache. Cached frames are shared - callers must not mutate them.
+# A cached entry grows with the square of the expression length, so only
+# expressions up to CACHE_MAX_LENGTH are cached; longer ones are rebuilt.
+CACHE_SIZE = 256
+CACHE_MAX_LENGTH = 200
+
 def execute(params):
-    frames = []
     prefix = params.get('expression', "+*23/84")
+    if len(prefix) > CACHE_MAX_LENGTH:
+        return tuple(generate_frames(prefix))
+    return cached_frames(prefix)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_frames(prefix):
+    """All conversion frames for one expression; reset with cached_frames.cache_clear()"""
+    return tuple(generate_frames(prefix))
+
+def convert(prefix):
+    """Frame-free fast path: the postfix execute() reports, or None if invalid"""
+    if len(prefix) > CACHE_MAX_LENGTH:
+        return _convert(prefix)
+    return _cached_convert(prefix)
+
+def _convert(prefix):
+    # Sub-expressions are (left, right, operator) nodes, not concatenated
+    # strings, so each token is copied once - in the final join - not once per
+    # enclosing operator.
+    stack = []
+    for char, code in zip(reversed(prefix), reversed(prefix.translate(CLASS_TRANS))):
+        cls = ord(code)
+        if cls > OTHER:  # Non-ASCII keeps the old isalnum() rule
+            cls = OPERAND if char.isalnum() else OTHER
+        
+        if cls == OPERAND:
+            stack.append(char)
+        elif cls == OPERATOR and len(stack) >= 2:
+            op1 = stack.pop()
+            op2 = stack.pop()
+            stack.append((op1, op2, char))
+    if len(stack) != 1:
+        return None
     
+    tokens, pending = [], [stack[0]]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, tuple):
+            pending.extend(reversed(node))
+        else:
+            tokens.append(node)
+    return ''.join(tokens)
+
+_cached_convert = lru_cache(maxsize=CACHE_SIZE)(_convert)
+
+def generate_frames(prefix):
     # Frame 0: Intro
-    frames.append({
+    yield {
         "description": f"🔄 Prefix → Postfix: '{prefix}'",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
     # Frame 1: Strategy
-    frames.append({
+    yield {
         "description": "📚 Strategy: Scan RIGHT to LEFT, build postfix",
         "data": {"values": [], "highlights": {}}
-    })
+    }
     
     # Frame 2: Initial
     stack = []
-    frames.append({
+    snap = ()  # immutable snapshot, refreshed only when the stack changes
+    yield {
         "description": f"📋 Input: '{prefix}' | Stack: []",
-        "data": {"values": stack.copy(), "highlights": {}}
-    })
+        "data": {"values": snap, "highlights": {}}
+    }
     
     # Scan right to left
-    for i in range(len(prefix) - 1, -1, -1):
-        char = prefix[i]
+    last = len(prefix) - 1
+    classes = prefix.translate(CLASS_TRANS)
+    for k, (char, code) in enumerate(zip(reversed(prefix), reversed(classes))):
+        i = last - k
+        cls = ord(code)
+        if cls > OTHER:  # Non-ASCII keeps the old isalnum() rule
+            cls = OPERAND if char.isalnum() else OTHER
         
-        frames.append({
+        yield {
             "description": f"📍 Scan from RIGHT: '{char}' at position {i}",
-            "data": {"values": stack.copy(), "highlights": {}}
-        })
+            "data": {"values": snap, "highlights": {}}
+        }
         
-        if char.isalnum():
+        if cls == OPERAND:
             stack.append(char)
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"🔤 '{char}' is operand → Push",
                 "data": {
-                    "values": stack.copy(),
+                    "values": snap,
                     "highlights": {"indices": [len(stack)-1], "colors": ["#2ecc71"], "labels": ["PUSHED"]}
                 }
-            })
+            }
         
-        elif char in '+-*/':
+        elif cls == OPERATOR:
             if len(stack) < 2:
-                frames.append({
+                yield {
                     "description": "❌ Error: Need 2 operands!",
-                    "data": {"values": stack.copy(), "highlights": {}}
-                })
+                    "data": {"values": snap, "highlights": {}}
+                }
                 continue
             
             # Pop two operands
             op1 = stack.pop()
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"⬆️ Pop first: '{op1}'",
-                "data": {"values": stack.copy(), "highlights": {}}
-            })
+                "data": {"values": snap, "highlights": {}}
+            }
             
             op2 = stack.pop()
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"⬆️ Pop second: '{op2}'",
-                "data": {"values": stack.copy(), "highlights": {}}
-            })
+                "data": {"values": snap, "highlights": {}}
+            }
             
             # Form postfix expression
             exp = f"{op1}{op2}{char}"
-            frames.append({
+            yield {
                 "description": f"🔗 Form postfix: {op1} {op2} {char} = '{exp}'",
-                "data": {"values": stack.copy(), "highlights": {}}
-            })
+                "data": {"values": snap, "highlights": {}}
+            }
             
             stack.append(exp)
-            frames.append({
+            snap = tuple(stack)
+            yield {
                 "description": f"📌 Push sub-expression: '{exp}'",
                 "data": {
-                    "values": stack.copy(),
+                    "values": snap,
                     "highlights": {"indices": [len(stack)-1], "colors": ["#3498db"], "labels": ["SUB-EXP"]}
                 }
-            })
+            }
     
     # Final
     if stack and len(stack) == 1:
         result = stack[0]
-        frames.append({
+        yield {
             "description": f"✅ COMPLETE! Postfix: '{result}'",
             "data": {
                 "values": [result],
                 "highlights": {"indices": [0], "colors": ["#2ecc71"], "labels": ["RESULT"]}
             }
-        })
+        }
         
-        frames.append({
+        yield {
             "description": f"📊 '{prefix}' (prefix) = '{result}' (postfix)",
             "data": {"values": [result], "highlights": {}}
-        })
+        }
     else:
-        frames.append({
+        yield {
             "description": "❌ Error: Invalid expression",
-            "data": {"values": stack.copy(), "highlights": {}}
-        })
+            "data": {"values": snap, "highlights": {}}
+        }
     
-    frames.append({
+    yield {
         "description": "⏱️ Time: O(n) | Space: O(n)",
-        "data": {"values": stack.copy(), "highlights": {}}
-    })
-    
-    return frames
+        "data": {"values": snap, "highlights": {}}
+    }
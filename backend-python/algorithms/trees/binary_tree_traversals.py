@@ -1,8 +1,9 @@
 """
 Binary Tree Traversals - Enhanced with 15+ production-grade frames
 """
-from typing import List, Dict, Any
-from .tree_utils import build_tree_from_array, serialize_tree, create_empty_frame, TreeNode
+from itertools import count
+from typing import Dict, Any, Iterator
+from .tree_utils import build_tree_shared, serialize_tree, create_empty_frame, tree_ref, build_value_index, TreeNode
 
 METADATA = {
     "name": "Binary Tree Traversals",
@@ -15,85 +16,96 @@ METADATA = {
     }
 }
 
-def traverse_inorder(node, serialized, result, frames, frame_id_list):
-    if not node:
-        return
-    
-    traverse_inorder(node.left, serialized, result, frames, frame_id_list)
-    
-    # Visit node
-    node_id = next((n["id"] for n in serialized if n["value"] == node.value), None)
-    result.append(node.value)
-    
-    frame = create_empty_frame(frame_id_list[0], f"📍 Visit: {node.value} | Inorder: LEFT → ROOT → RIGHT | Result so far: {result}")
-    frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                      "highlights": {"node_ids": [node_id], "colors": ["#2ecc71"], "labels": ["VISITING"]}}]
-    frame["variables"] = [{"name": "current_node", "value": str(node.value), "type": "int"},
-                          {"name": "result", "value": str(result), "type": "array"}]
-    frames.append(frame)
-    frame_id_list[0] += 1
-    
-    traverse_inorder(node.right, serialized, result, frames, frame_id_list)
+class VisitLog:
+    """Visited values plus str() of that list, extended per visit instead of rebuilt"""
+    __slots__ = ("values", "text")
+    
+    def __init__(self):
+        self.values = []
+        self.text = "[]"
+    
+    def append(self, value):
+        item = repr(value)  # list.__str__ uses repr() of each element
+        self.text = f"{self.text[:-1]}, {item}]" if self.values else f"[{item}]"
+        self.values.append(value)
 
-def traverse_preorder(node, serialized, result, frames, frame_id_list):
-    if not node:
-        return
-    
-    # Visit node first
-    node_id = next((n["id"] for n in serialized if n["value"] == node.value), None)
+def visit_frame(frame_id, node, order, color, value_to_id, result):
+    """Record a visit of node and build its frame"""
+    node_id = value_to_id[node.value]  # every node value is indexed
     result.append(node.value)
     
-    frame = create_empty_frame(frame_id_list[0], f"📍 Visit: {node.value} | Preorder: ROOT → LEFT → RIGHT | Result so far: {result}")
-    frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                      "highlights": {"node_ids": [node_id], "colors": ["#3498db"], "labels": ["VISITING"]}}]
+    frame = create_empty_frame(frame_id, f"📍 Visit: {node.value} | {order} | Result so far: {result.text}")
+    frame["trees"] = [tree_ref("Binary Search Tree", "tree",
+                               {"node_ids": [node_id], "colors": [color], "labels": ["VISITING"]})]
     frame["variables"] = [{"name": "current_node", "value": str(node.value), "type": "int"},
-                          {"name": "result", "value": str(result), "type": "array"}]
-    frames.append(frame)
-    frame_id_list[0] += 1
-    
-    traverse_preorder(node.left, serialized, result, frames, frame_id_list)
-    traverse_preorder(node.right, serialized, result, frames, frame_id_list)
+                          {"name": "result", "value": result.text, "type": "array"}]
+    return frame
 
-def traverse_postorder(node, serialized, result, frames, frame_id_list):
-    if not node:
-        return
-    
-    traverse_postorder(node.left, serialized, result, frames, frame_id_list)
-    traverse_postorder(node.right, serialized, result, frames, frame_id_list)
-    
-    # Visit node last
-    node_id = next((n["id"] for n in serialized if n["value"] == node.value), None)
-    result.append(node.value)
-    
-    frame = create_empty_frame(frame_id_list[0], f"📍 Visit: {node.value} | Postorder: LEFT → RIGHT → ROOT | Result so far: {result}")
-    frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                      "highlights": {"node_ids": [node_id], "colors": ["#9b59b6"], "labels": ["VISITING"]}}]
-    frame["variables"] = [{"name": "current_node", "value": str(node.value), "type": "int"},
-                          {"name": "result", "value": str(result), "type": "array"}]
-    frames.append(frame)
-    frame_id_list[0] += 1
+# Traversals use an explicit stack - no Python frame per node and no
+# recursion-limit crash on skewed trees. Each yields its visit frames,
+# numbered from the shared frame id counter.
+
+def traverse_inorder(root, value_to_id, result, frame_ids):
+    stack, node = [], root
+    while stack or node:
+        # Push the whole left spine, then visit and move right
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield visit_frame(next(frame_ids), node, "Inorder: LEFT → ROOT → RIGHT", "#2ecc71",
+                          value_to_id, result)
+        node = node.right
+
+def traverse_preorder(root, value_to_id, result, frame_ids):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield visit_frame(next(frame_ids), node, "Preorder: ROOT → LEFT → RIGHT", "#3498db",
+                          value_to_id, result)
+        # Right first so left is popped (visited) first
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
 
-def execute(params: dict) -> List[Dict[str, Any]]:
-    frames, frame_id = [], 0
+def traverse_postorder(root, value_to_id, result, frame_ids):
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            yield visit_frame(next(frame_ids), node, "Postorder: LEFT → RIGHT → ROOT", "#9b59b6",
+                              value_to_id, result)
+            continue
+        # Revisit after both subtrees; right pushed first so left runs first
+        stack.append((node, True))
+        if node.right:
+            stack.append((node.right, False))
+        if node.left:
+            stack.append((node.left, False))
+
+def execute(params: dict) -> Iterator[Dict[str, Any]]:
+    frame_ids = count()
     tree_values = params.get('tree_values', [])
     traversal_type = params.get('traversal_type', 'inorder').lower()
     
-    root = build_tree_from_array(tree_values)
+    root = build_tree_shared(tree_values)  # read-only below
+    # The tree never changes - serialize once, every frame references it
+    serialized = serialize_tree(root) if root else None
     
-    # Frame 0: Intro
-    frame = create_empty_frame(frame_id, "🌳 Binary Tree Traversals: Systematic ways to visit every node exactly once")
+    # Frame 0: Intro - also ships the node list the later frames reference
+    frame = create_empty_frame(next(frame_ids), "🌳 Binary Tree Traversals: Systematic ways to visit every node exactly once")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
+        frame["fixtures"] = {"tree": serialized}
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
     frame["variables"] = [{"name": "traversal_type", "value": traversal_type.upper(), "type": "string"}]
-    frames.append(frame)
-    frame_id += 1
+    yield frame
     
     # Frame 1: Three types explained
-    frame = create_empty_frame(frame_id, "📚 Three Types: (1) INORDER: Left→Root→Right (2) PREORDER: Root→Left→Right (3) POSTORDER: Left→Right→Root")
+    frame = create_empty_frame(next(frame_ids), "📚 Three Types: (1) INORDER: Left→Root→Right (2) PREORDER: Root→Left→Right (3) POSTORDER: Left→Right→Root")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
-    frame_id += 1
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
+    yield frame
     
     # Frame 2: Selected type
     type_desc = {
@@ -102,44 +114,38 @@ def execute(params: dict) -> List[Dict[str, Any]]:
         'postorder': "POSTORDER: Visit left subtree, then right subtree, then root last (good for deleting tree)"
     }
     
-    frame = create_empty_frame(frame_id, f"🎯 Selected: {traversal_type.upper()} | {type_desc.get(traversal_type, '')}")
+    frame = create_empty_frame(next(frame_ids), f"🎯 Selected: {traversal_type.upper()} | {type_desc.get(traversal_type, '')}")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
-    frame_id += 1
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
+    yield frame
     
     # Frame 3: Recursion concept
-    frame = create_empty_frame(frame_id, "🔄 How it works: Uses RECURSION - function calls itself on left/right children until reaching NULL")
-    frames.append(frame)
-    frame_id += 1
+    frame = create_empty_frame(next(frame_ids), "🔄 How it works: Uses RECURSION - function calls itself on left/right children until reaching NULL")
+    yield frame
     
     if not root:
-        frame = create_empty_frame(frame_id, "Empty tree - nothing to traverse!")
-        frames.append(frame)
-        return frames
+        frame = create_empty_frame(next(frame_ids), "Empty tree - nothing to traverse!")
+        yield frame
+        return
     
     # Perform traversal
-    serialized = serialize_tree(root)
-    result = []
-    frame_id_list = [frame_id]
+    # value -> id, first (preorder) id wins like the old linear scan did
+    value_to_id = build_value_index(serialized)
+    result = VisitLog()
     
     if traversal_type == 'inorder':
-        traverse_inorder(root, serialized, result, frames, frame_id_list)
+        yield from traverse_inorder(root, value_to_id, result, frame_ids)
     elif traversal_type == 'preorder':
-        traverse_preorder(root, serialized, result, frames, frame_id_list)
+        yield from traverse_preorder(root, value_to_id, result, frame_ids)
     else:  # postorder
-        traverse_postorder(root, serialized, result, frames, frame_id_list)
-    
-    frame_id = frame_id_list[0]
+        yield from traverse_postorder(root, value_to_id, result, frame_ids)
     
     # Final summary
-    frame = create_empty_frame(frame_id, f"✅ {traversal_type.upper()} Traversal Complete! Visited {len(result)} nodes")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized}]
-    frame["variables"] = [{"name": "traversal_order", "value": str(result), "type": "array"},
-                          {"name": "nodes_visited", "value": str(len(result)), "type": "int"}]
-    frames.append(frame)
-    frame_id += 1
+    frame = create_empty_frame(next(frame_ids), f"✅ {traversal_type.upper()} Traversal Complete! Visited {len(result.values)} nodes")
+    frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
+    frame["variables"] = [{"name": "traversal_order", "value": result.text, "type": "array"},
+                          {"name": "nodes_visited", "value": str(len(result.values)), "type": "int"}]
+    yield frame
     
     # Usage explanation
     usage = {
@@ -148,8 +154,6 @@ def execute(params: dict) -> List[Dict[str, Any]]:
         'postorder': "Used for tree DELETION"
     }
     
-    frame = create_empty_frame(frame_id, f"💡 Use Case: {usage.get(traversal_type, '')} | Time: O(n), Space: O(h)")
-    frame["variables"] = [{"name": "result", "value": str(result), "type": "array"}]
-    frames.append(frame)
-    
-    return frames
+    frame = create_empty_frame(next(frame_ids), f"💡 Use Case: {usage.get(traversal_type, '')} | Time: O(n), Space: O(h)")
+    frame["variables"] = [{"name": "result", "value": result.text, "type": "array"}]
+    yield frame
@@ -1,8 +1,9 @@
 """
 BST Delete - Enhanced with 15+ production-grade frames
 """
-from typing import List, Dict, Any
-from .tree_utils import build_tree_from_array, serialize_tree, create_empty_frame, TreeNode
+from itertools import count
+from typing import Dict, Any, Iterator
+from .tree_utils import build_tree_cached, serialize_tree, create_empty_frame, replace_value, TreeNode
 
 METADATA = {
     "name": "BST Delete",
@@ -12,69 +13,42 @@ METADATA = {
     "default_input": {"tree_values": [50, 30, 70, 20, 40, 60, 80], "delete_value": 30}
 }
 
-def find_min(node):
-    while node and node.left:
-        node = node.left
-    return node
+# Highlight colors
+TARGET_COLOR = "#e74c3c"
+CHECKING_COLOR = "#f39c12"
+CASE_COLOR = "#e67e22"
+SUCCESSOR_COLOR = "#2ecc71"
 
-def delete_node_recursive(root, value, frames, frame_id_list):
-    if not root:
-        return root
-    
-    if value < root.value:
-        root.left = delete_node_recursive(root.left, value, frames, frame_id_list)
-    elif value > root.value:
-        root.right = delete_node_recursive(root.right, value, frames, frame_id_list)
-    else:
-        # Node found - delete it
-        if not root.left and not root.right:
-            return None
-        elif not root.left:
-            return root.right
-        elif not root.right:
-            return root.left
-        else:
-            # Two children - use inorder successor
-            successor = find_min(root.right)
-            root.value = successor.value
-            root.right = delete_node_recursive(root.right, successor.value, frames, frame_id_list)
-    
-    return root
-
-def execute(params: dict) -> List[Dict[str, Any]]:
-    frames, frame_id = [], 0
+def execute(params: dict) -> Iterator[Dict[str, Any]]:
+    frame_ids = count()
     tree_values, delete_value = params.get('tree_values', []), params.get('delete_value')
     
     if delete_value is None:
-        frames.append(create_empty_frame(0, "Error: No value provided to delete"))
-        return frames
+        yield create_empty_frame(0, "Error: No value provided to delete")
+        return
     
-    root = build_tree_from_array(tree_values)
+    root = build_tree_cached(tree_values)
+    # One snapshot per tree state, shared by every frame showing that state
+    serialized = serialize_tree(root)
     
     # Frame 0: Intro
-    frame = create_empty_frame(frame_id, "🗑️ BST Delete: Removing a node while maintaining the Binary Search Tree property")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frame["variables"] = [{"name": "delete_value", "value": str(delete_value), "type": "int"}]
-    frames.append(frame)
-    frame_id += 1
+    tree = [{"name": "Binary Search Tree", "nodes": serialized}] if root else None
+    yield create_empty_frame(next(frame_ids), "🗑️ BST Delete: Removing a node while maintaining the Binary Search Tree property",
+                             trees=tree,
+                             variables=[{"name": "delete_value", "value": str(delete_value), "type": "int"}])
     
     # Frame 1: Three cases explained
-    frame = create_empty_frame(frame_id, f"🎯 Goal: Delete {delete_value}. Three cases exist: (1) Leaf node (2) One child (3) Two children")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
-    frame_id += 1
+    yield create_empty_frame(next(frame_ids), f"🎯 Goal: Delete {delete_value}. Three cases exist: (1) Leaf node (2) One child (3) Two children",
+                             trees=tree)
     
     # Frame 2: Strategy
-    frame = create_empty_frame(frame_id, "🧭 Strategy: First find the node, identify its case, then apply appropriate deletion method")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
-    frame_id += 1
+    yield create_empty_frame(next(frame_ids), "🧭 Strategy: First find the node, identify its case, then apply appropriate deletion method",
+                             trees=tree)
     
-    # Search for node
+    # Search for node, following node ids down the child links alongside current
     current, parent = root, None
+    went_left = False  # which child link of parent leads to current
+    node_id = 0
     found, comparisons = False, 0
     path = []
     
@@ -82,51 +56,40 @@ def execute(params: dict) -> List[Dict[str, Any]]:
         comparisons += 1
         path.append(current.value)
         
-        serialized = serialize_tree(root)
-        node_id = next((n["id"] for n in serialized if n["value"] == current.value), None)
-        
         if current.value == delete_value:
             found = True
-            frame = create_empty_frame(frame_id, f"✓ Found node {delete_value} after {comparisons} comparisons!")
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                              "highlights": {"node_ids": [node_id], "colors": ["#e74c3c"], "labels": ["FOUND"]}}]
-            frames.append(frame)
-            frame_id += 1
+            yield create_empty_frame(next(frame_ids), f"✓ Found node {delete_value} after {comparisons} comparisons!",
+                                     trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                             "highlights": {"node_ids": [node_id], "colors": [TARGET_COLOR], "labels": ["FOUND"]}}])
             break
         
-        frame = create_empty_frame(frame_id, f"🔍 Searching... {delete_value} {'<' if delete_value < current.value else '>'} {current.value}, go {'LEFT' if delete_value < current.value else 'RIGHT'}")
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                          "highlights": {"node_ids": [node_id], "colors": ["#f39c12"], "labels": ["CHECKING"]}}]
-        frames.append(frame)
-        frame_id += 1
+        went_left = delete_value < current.value
+        yield create_empty_frame(next(frame_ids), f"🔍 Searching... {delete_value} {'<' if went_left else '>'} {current.value}, go {'LEFT' if went_left else 'RIGHT'}",
+                                 trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                         "highlights": {"node_ids": [node_id], "colors": [CHECKING_COLOR], "labels": ["CHECKING"]}}])
         
         parent = current
-        current = current.left if delete_value < current.value else current.right
+        if went_left:
+            current, node_id = current.left, serialized[node_id]["left_child_id"]
+        else:
+            current, node_id = current.right, serialized[node_id]["right_child_id"]
     
     if not found:
-        frame = create_empty_frame(frame_id, f"❌ Node {delete_value} not found in tree")
-        frames.append(frame)
-        return frames
+        yield create_empty_frame(next(frame_ids), f"❌ Node {delete_value} not found in tree")
+        return
     
     # Determine case
-    serialized = serialize_tree(root)
-    node_id = next((n["id"] for n in serialized if n["value"] == delete_value), None)
-    
     if not current.left and not current.right:
         # CASE 1: Leaf
-        frame = create_empty_frame(frame_id, f"📋 CASE 1 DETECTED: Leaf Node (no children)")
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                          "highlights": {"node_ids": [node_id], "colors": ["#e67e22"], "labels": ["LEAF"]}}]
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"📋 CASE 1 DETECTED: Leaf Node (no children)",
+                                 trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                         "highlights": {"node_ids": [node_id], "colors": [CASE_COLOR], "labels": ["LEAF"]}}])
         
-        frame = create_empty_frame(frame_id, f"✂️ Simply remove the leaf node {delete_value}")
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"✂️ Simply remove the leaf node {delete_value}")
         
         if parent is None:
             root = None
-        elif parent.left == current:
+        elif went_left:
             parent.left = None
         else:
             parent.right = None
@@ -136,76 +99,62 @@ def execute(params: dict) -> List[Dict[str, Any]]:
         child = current.left or current.right
         child_side = "LEFT" if current.left else "RIGHT"
         
-        frame = create_empty_frame(frame_id, f"📋 CASE 2 DETECTED: One Child (has {child_side} child: {child.value})")
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                          "highlights": {"node_ids": [node_id], "colors": ["#e67e22"], "labels": ["ONE CHILD"]}}]
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"📋 CASE 2 DETECTED: One Child (has {child_side} child: {child.value})",
+                                 trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                         "highlights": {"node_ids": [node_id], "colors": [CASE_COLOR], "labels": ["ONE CHILD"]}}])
         
-        frame = create_empty_frame(frame_id, f"🔄 Replace node {delete_value} with its child {child.value}")
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"🔄 Replace node {delete_value} with its child {child.value}")
         
         if parent is None:
             root = child
-        elif parent.left == current:
+        elif went_left:
             parent.left = child
         else:
             parent.right = child
             
     else:
         # CASE 3: Two children
-        frame = create_empty_frame(frame_id, f"📋 CASE 3 DETECTED: Two Children (most complex case)")
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                          "highlights": {"node_ids": [node_id], "colors": ["#e67e22"], "labels": ["TWO CHILDREN"]}}]
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"📋 CASE 3 DETECTED: Two Children (most complex case)",
+                                 trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                         "highlights": {"node_ids": [node_id], "colors": [CASE_COLOR], "labels": ["TWO CHILDREN"]}}])
         
-        frame = create_empty_frame(frame_id, "🔍 Finding inorder successor (minimum value in right subtree)...")
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), "🔍 Finding inorder successor (minimum value in right subtree)...")
         
-        successor = find_min(current.right)
-        serialized = serialize_tree(root)
-        succ_id = next((n["id"] for n in serialized if n["value"] == successor.value), None)
+        # Leftmost node of the right subtree; keep its parent so it can be
+        # spliced out directly instead of searching for it again
+        succ_parent, successor = current, current.right
+        succ_id = serialized[node_id]["right_child_id"]
+        while successor.left:
+            succ_parent, successor = successor, successor.left
+            succ_id = serialized[succ_id]["left_child_id"]
         
-        frame = create_empty_frame(frame_id, f"✓ Found inorder successor: {successor.value}")
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                          "highlights": {"node_ids": [succ_id, node_id], "colors": ["#2ecc71", "#e74c3c"], 
-                                       "labels": ["SUCCESSOR", "TO DELETE"]}}]
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"✓ Found inorder successor: {successor.value}",
+                                 trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                         "highlights": {"node_ids": [succ_id, node_id], "colors": [SUCCESSOR_COLOR, TARGET_COLOR],
+                                                        "labels": ["SUCCESSOR", "TO DELETE"]}}])
         
         successor_value = successor.value
         current.value = successor_value
         
-        frame = create_empty_frame(frame_id, f"📝 Replace {delete_value} with successor value {successor_value}")
-        serialized = serialize_tree(root)
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized}]
-        frames.append(frame)
-        frame_id += 1
+        serialized = replace_value(serialized, node_id, successor_value)
+        yield create_empty_frame(next(frame_ids), f"📝 Replace {delete_value} with successor value {successor_value}",
+                                 trees=[{"name": "Binary Search Tree", "nodes": serialized}])
         
         # Delete successor (which is now duplicate)
-        frame = create_empty_frame(frame_id, f"🗑️ Remove the duplicate successor node from right subtree")
-        frames.append(frame)
-        frame_id += 1
+        yield create_empty_frame(next(frame_ids), f"🗑️ Remove the duplicate successor node from right subtree")
         
-        frame_id_list = [frame_id]
-        root = delete_node_recursive(root, successor_value, frames, frame_id_list)
-        frame_id = frame_id_list[0]
+        # The successor has no left child, so its right subtree takes its place
+        if succ_parent is current:
+            succ_parent.right = successor.right
+        else:
+            succ_parent.left = successor.right
     
     # Final frames
-    frame = create_empty_frame(frame_id, f"✅ Deletion Complete! BST property maintained. Tree now has {len(tree_values)-1} nodes")
-    if root:
-        frame["trees"] = [{"name": "Final Binary Search Tree", "nodes": serialize_tree(root)}]
-    frame["variables"] = [{"name": "deleted_value", "value": str(delete_value), "type": "int"},
-                          {"name": "comparisons", "value": str(comparisons), "type": "int"}]
-    frames.append(frame)
-    frame_id += 1
-    
-    frame = create_empty_frame(frame_id, "⏱️ Time Complexity: O(h) to find + O(h) to delete = O(h) where h is height")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
+    serialized = serialize_tree(root)
+    yield create_empty_frame(next(frame_ids), f"✅ Deletion Complete! BST property maintained. Tree now has {len(tree_values)-1} nodes",
+                             trees=[{"name": "Final Binary Search Tree", "nodes": serialized}] if root else None,
+                             variables=[{"name": "deleted_value", "value": str(delete_value), "type": "int"},
+                                        {"name": "comparisons", "value": str(comparisons), "type": "int"}])
     
-    return frames
+    yield create_empty_frame(next(frame_ids), "⏱️ Time Complexity: O(h) to find + O(h) to delete = O(h) where h is height",
+                             trees=[{"name": "Binary Search Tree", "nodes": serialized}] if root else None)
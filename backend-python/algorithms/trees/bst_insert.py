@@ -3,11 +3,13 @@ BST Insert Algorithm - PRODUCTION GRADE with 15-20 frames
 Enhanced with educational content and detailed step-by-step visualization
 """
 
-from typing import List, Dict, Any
+from itertools import count
+from typing import Dict, Any, Iterator
 from .tree_utils import (
-    build_tree_from_array,
+    build_tree_cached,
     serialize_tree,
     create_empty_frame,
+    attach_child,
     TreeNode
 )
 
@@ -24,353 +26,264 @@ METADATA = {
 }
 
 
-def execute(params: dict) -> List[Dict[str, Any]]:
+# Highlight colors
+START_COLOR = "#9b59b6"
+VISITED_COLOR = "#95a5a6"
+COMPARING_COLOR = "#f39c12"
+PARENT_COLOR = "#3498db"
+INSERTION_PARENT_COLOR = "#e67e22"
+INSERTED_COLOR = "#2ecc71"
+
+# Wording for each direction, keyed by `insert_value < current.value`
+DIRECTIONS = {
+    True: {"side": "left", "Side": "Left", "SIDE": "LEFT", "symbol": "<",
+           "decision": "GO LEFT ←", "rule": "smaller than", "link": "left_child_id"},
+    False: {"side": "right", "Side": "Right", "SIDE": "RIGHT", "symbol": ">",
+            "decision": "GO RIGHT →", "rule": "greater than", "link": "right_child_id"},
+}
+
+# Constant variables, shared by reference across frames (frames are read-only)
+RULE_VAR = {"name": "rule", "value": "Left < Parent < Right", "type": "string"}
+STRATEGY_VAR = {"name": "strategy", "value": "Compare & Navigate", "type": "string"}
+START_POSITION_VAR = {"name": "current_position", "value": "ROOT (50)", "type": "string"}
+STATUS_VAR = {"name": "status", "value": "SUCCESS ✅", "type": "string"}
+BEST_CASE_VAR = {"name": "best_case", "value": "O(log n) - balanced tree", "type": "string"}
+WORST_CASE_VAR = {"name": "worst_case", "value": "O(n) - skewed tree", "type": "string"}
+
+# Per-step descriptions, filled from a direction plus value/node/child
+COMPARE_DESC = "🔍 Compare: {value} {symbol} {node}? YES! → BST rule says go {SIDE}"
+WHY_DESC = "💡 WHY go {side}? Because in BST, ALL values in {side} subtree must be {rule} {node}"
+NULL_SPOT_DESC = "🎯 Found NULL spot! {Side} child of {node} is empty - perfect place for {value}!"
+INSERT_DESC = "✨ INSERT! Creating new node with value {value} as {SIDE} CHILD of {node}"
+VERIFY_DESC = "✅ Verify: {value} {symbol} {node}? YES! BST property maintained"
+MOVE_DESC = "➡️ Moving to {side} child... Next node to check: {child}"
+
+
+def execute(params: dict) -> Iterator[Dict[str, Any]]:
     """Execute BST insert with detailed 15-20 frame visualization"""
-    frames = []
-    
     tree_values = params.get('tree_values', [])
     insert_value = params.get('insert_value')
     
     if insert_value is None:
-        frame = create_empty_frame(0, "Error: No value provided to insert")
-        frames.append(frame)
-        return frames
+        yield create_empty_frame(0, "Error: No value provided to insert")
+        return
     
-    if insert_value in [v for v in tree_values if v is not None]:
-        frame = create_empty_frame(0, f"Error: Value {insert_value} already exists in BST. Duplicates not allowed.")
-        frames.append(frame)
-        return frames
+    if any(v == insert_value for v in tree_values if v is not None):
+        yield create_empty_frame(0, f"Error: Value {insert_value} already exists in BST. Duplicates not allowed.")
+        return
     
-    root = build_tree_from_array(tree_values)
-    frame_id = 0
+    root = build_tree_cached(tree_values)
+    # One snapshot per tree state, shared by every frame showing that state
+    serialized = serialize_tree(root)
+    frame_ids = count()
+    # Same value in every frame - build once per call
+    insert_var = {"name": "insert_value", "value": str(insert_value), "type": "int"}
+    our_value_var = {"name": "our_value", "value": insert_var["value"], "type": "int"}
     
     # FRAME 0: Introduction - What is BST Insert?
-    frame = create_empty_frame(frame_id, "📚 BST Insert: Maintaining the Binary Search Tree Property")
-    if root:
-        frame["trees"] = [{"name": "Initial Binary Search Tree", "nodes": serialize_tree(root)}]
-    frame["variables"] = [
-        {"name": "insert_value", "value": str(insert_value), "type": "int"},
-        {"name": "rule", "value": "Left < Parent < Right", "type": "string"}
-    ]
-    frames.append(frame)
-    frame_id += 1
+    yield create_empty_frame(
+        next(frame_ids), "📚 BST Insert: Maintaining the Binary Search Tree Property",
+        trees=[{"name": "Initial Binary Search Tree", "nodes": serialized}] if root else None,
+        variables=[
+            insert_var,
+            RULE_VAR
+        ]
+    )
     
     # FRAME 1: Show the value to insert with explanation
-    frame = create_empty_frame(frame_id, f"🎯 Goal: Insert value {insert_value} while maintaining BST property (all left children < parent < all right children)")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frame["variables"] = [
-        {"name": "insert_value", "value": str(insert_value), "type": "int"},
-        {"name": "strategy", "value": "Compare & Navigate", "type": "string"},
-        {"name": "total_nodes", "value": str(len(tree_values)), "type": "int"}
-    ]
-    frames.append(frame)
-    frame_id += 1
+    yield create_empty_frame(
+        next(frame_ids), f"🎯 Goal: Insert value {insert_value} while maintaining BST property (all left children < parent < all right children)",
+        trees=[{"name": "Binary Search Tree", "nodes": serialized}] if root else None,
+        variables=[
+            insert_var,
+            STRATEGY_VAR,
+            {"name": "total_nodes", "value": str(len(tree_values)), "type": "int"}
+        ]
+    )
     
     # FRAME 2: Strategy explanation
-    frame = create_empty_frame(frame_id, "🧭 Strategy: Start at root, compare values, go left if smaller, right if larger, until we find an empty spot")
-    if root:
-        serialized = serialize_tree(root)
-        frame["trees"] = [{
+    yield create_empty_frame(
+        next(frame_ids), "🧭 Strategy: Start at root, compare values, go left if smaller, right if larger, until we find an empty spot",
+        trees=[{
             "name": "Binary Search Tree",
             "nodes": serialized,
             "highlights": {
                 "node_ids": [0],  # Highlight root
-                "colors": ["#9b59b6"],
+                "colors": [START_COLOR],
                 "labels": ["START HERE"]
             }
-        }]
-    frame["variables"] = [
-        {"name": "insert_value", "value": str(insert_value), "type": "int"},
-        {"name": "current_position", "value": "ROOT (50)", "type": "string"}
-    ]
-    frames.append(frame)
-    frame_id += 1
+        }] if root else None,
+        variables=[
+            insert_var,
+            START_POSITION_VAR
+        ]
+    )
     
     if not root:
         # Empty tree case
         root = TreeNode(insert_value)
-        frame = create_empty_frame(frame_id, f"🌱 Tree is empty! {insert_value} becomes the root node (first node in the tree)")
-        frame["trees"] = [{
-            "name": "Binary Search Tree",
-            "nodes": serialize_tree(root),
-            "highlights": {
-                "node_ids": [0],
-                "colors": ["#2ecc71"],
-                "labels": ["NEW ROOT"]
-            }
-        }]
-        frames.append(frame)
-        return frames
+        yield create_empty_frame(
+            next(frame_ids), f"🌱 Tree is empty! {insert_value} becomes the root node (first node in the tree)",
+            trees=[{
+                "name": "Binary Search Tree",
+                "nodes": serialize_tree(root),
+                "highlights": {
+                    "node_ids": [0],
+                    "colors": [INSERTED_COLOR],
+                    "labels": ["NEW ROOT"]
+                }
+            }]
+        )
+        return
     
-    # Traverse and insert
+    # Traverse and insert. Node ids are followed down the child links as we
+    # descend instead of being looked up by value.
     current = root
+    current_node_id = 0
     path_values = []
+    path_text = ""  # " → ".join of path_values, extended per step instead of rebuilt
+    path_node_ids = []
+    # Highlight lists for the visited path, grown one entry per step alongside path_node_ids
+    visited_colors, visited_labels = [], []
     comparisons = 0
     
     while current:
         comparisons += 1
-        serialized = serialize_tree(root)
-        
-        # Find IDs for all nodes in path
-        current_node_id = None
-        path_node_ids = []
-        for node in serialized:
-            if node["value"] == current.value:
-                current_node_id = node["id"]
-            if node["value"] in path_values:
-                path_node_ids.append(node["id"])
-        
+        path_text = f"{path_text} → {current.value}" if path_values else str(current.value)
         path_values.append(current.value)
         
-        # Comparison decision frame
-        if insert_value < current.value:
-            # FRAME: Show comparison - going left
-            frame = create_empty_frame(frame_id, f"🔍 Compare: {insert_value} < {current.value}? YES! → BST rule says go LEFT")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": path_node_ids + [current_node_id],
-                    "colors": ["#95a5a6"] * len(path_node_ids) + ["#f39c12"],
-                    "labels": ["VISITED"] * len(path_node_ids) + ["COMPARING"]
-                }
-            }]
-            frame["variables"] = [
-                {"name": "insert_value", "value": str(insert_value), "type": "int"},
-                {"name": "current_node", "value": str(current.value), "type": "int"},
-                {"name": "comparison", "value": f"{insert_value} < {current.value}", "type": "string"},
-                {"name": "decision", "value": "GO LEFT ←", "type": "string"},
-                {"name": "comparisons_made", "value": str(comparisons), "type": "int"},
-                {"name": "path", "value": " → ".join(map(str, path_values)), "type": "string"}
-            ]
-            frames.append(frame)
-            frame_id += 1
-            
-            # FRAME: Explain WHY we go left
-            frame = create_empty_frame(frame_id, f"💡 WHY go left? Because in BST, ALL values in left subtree must be smaller than {current.value}")
-            frame["trees"] = [{
-                "name": "Binary Search Tree", 
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": [current_node_id],
-                    "colors": ["#3498db"],
-                    "labels": ["PARENT"]
-                }
-            }]
-            frame["variables"] = [
-                {"name": "rule", "value": f"Left < {current.value} < Right", "type": "string"},
-                {"name": "our_value", "value": str(insert_value), "type": "int"}
-            ]
-            frames.append(frame)
-            frame_id += 1
-            
-            if current.left is None:
-                # Found insertion point!
-                current.left = TreeNode(insert_value)
-                serialized = serialize_tree(root)
-                
-                new_node_id = None
-                for node in serialized:
-                    if node["value"] == insert_value:
-                        new_node_id = node["id"]
-                        break
-                
-                # FRAME: Found NULL spot frame = create_empty_frame(frame_id, f"🎯 Found NULL spot! Left child of {current.value} is empty - perfect place for {insert_value}!")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized,
-                    "highlights": {
-                        "node_ids": [current_node_id],
-                        "colors": ["#e67e22"],
-                        "labels": ["INSERTION PARENT"]
-                    }
-                }]
-                frames.append(frame)
-                frame_id += 1
-                
-                # FRAME: Actually insert
-                frame = create_empty_frame(frame_id, f"✨ INSERT! Creating new node with value {insert_value} as LEFT CHILD of {current.value}")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized,
-                    "highlights": {
-                        "node_ids": [new_node_id, current_node_id],
-                        "colors": ["#2ecc71", "#3498db"],
-                        "labels": ["INSERTED!", "PARENT"]
-                    }
-                }]
-                frame["variables"] = [
-                    {"name": "inserted_value", "value": str(insert_value), "type": "int"},
-                    {"name": "parent_node", "value": str(current.value), "type": "int"},
-                    {"name": "position", "value": "LEFT CHILD", "type": "string"},
-                    {"name": "total_comparisons", "value": str(comparisons), "type": "int"}
-                ]
-                frames.append(frame)
-                frame_id += 1
-                
-                # FRAME: Verify BST property maintained
-                frame = create_empty_frame(frame_id, f"✅ Verify: {insert_value} < {current.value}? YES! BST property maintained")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized,
-                    "highlights": {
-                        "node_ids": [new_node_id],
-                        "colors": ["#2ecc71"],
-                        "labels": ["VALID POSITION"]
-                    }
-                }]
-                frames.append(frame)
-                frame_id += 1
-                break
-            else:
-                # FRAME: Moving to left child
-                frame = create_empty_frame(frame_id, f"➡️ Moving to left child... Next node to check: {current.left.value}")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized
-                }]
-                frames.append(frame)
-                frame_id += 1
-                current = current.left
-                
-        else:  # insert_value >= current.value
-            # FRAME: Show comparison - going right
-            frame = create_empty_frame(frame_id, f"🔍 Compare: {insert_value} > {current.value}? YES! → BST rule says go RIGHT")
-            frame["trees"] = [{
+        # Going LEFT and RIGHT differ only in wording and which child link is followed
+        direction = DIRECTIONS[insert_value < current.value]
+        side = direction["side"]
+        step = {**direction, "value": insert_value, "node": current.value}
+        
+        # FRAME: Show comparison
+        yield create_empty_frame(
+            next(frame_ids), COMPARE_DESC.format_map(step),
+            trees=[{
                 "name": "Binary Search Tree",
                 "nodes": serialized,
                 "highlights": {
                     "node_ids": path_node_ids + [current_node_id],
-                    "colors": ["#95a5a6"] * len(path_node_ids) + ["#f39c12"],
-                    "labels": ["VISITED"] * len(path_node_ids) + ["COMPARING"]
+                    "colors": visited_colors + [COMPARING_COLOR],
+                    "labels": visited_labels + ["COMPARING"]
                 }
-            }]
-            frame["variables"] = [
-                {"name": "insert_value", "value": str(insert_value), "type": "int"},
+            }],
+            variables=[
+                insert_var,
                 {"name": "current_node", "value": str(current.value), "type": "int"},
-                {"name": "comparison", "value": f"{insert_value} > {current.value}", "type": "string"},
-                {"name": "decision", "value": "GO RIGHT →", "type": "string"},
+                {"name": "comparison", "value": f"{insert_value} {direction['symbol']} {current.value}", "type": "string"},
+                {"name": "decision", "value": direction["decision"], "type": "string"},
                 {"name": "comparisons_made", "value": str(comparisons), "type": "int"},
-                {"name": "path", "value": " → ".join(map(str, path_values)), "type": "string"}
+                {"name": "path", "value": path_text, "type": "string"}
             ]
-            frames.append(frame)
-            frame_id += 1
-            
-            # FRAME: Explain WHY we go right
-            frame = create_empty_frame(frame_id, f"💡 WHY go right? Because in BST, ALL values in right subtree must be greater than {current.value}")
-            frame["trees"] = [{
+        )
+        
+        # FRAME: Explain WHY we go this way
+        yield create_empty_frame(
+            next(frame_ids), WHY_DESC.format_map(step),
+            trees=[{
                 "name": "Binary Search Tree",
                 "nodes": serialized,
                 "highlights": {
                     "node_ids": [current_node_id],
-                    "colors": ["#3498db"],
+                    "colors": [PARENT_COLOR],
                     "labels": ["PARENT"]
                 }
-            }]
-            frame["variables"] = [
+            }],
+            variables=[
                 {"name": "rule", "value": f"Left < {current.value} < Right", "type": "string"},
-                {"name": "our_value", "value": str(insert_value), "type": "int"}
+                our_value_var
             ]
-            frames.append(frame)
-            frame_id += 1
+        )
+        
+        child = getattr(current, side)
+        if child is None:
+            # Found insertion point!
+            setattr(current, side, TreeNode(insert_value))
+            # Patch the snapshot instead of re-serializing; the new node takes the next free id
+            serialized = attach_child(serialized, current_node_id, side, insert_value)
+            new_node_id = len(serialized) - 1
             
-            if current.right is None:
-                # Found insertion point!
-                current.right = TreeNode(insert_value)
-                serialized = serialize_tree(root)
-                
-                new_node_id = None
-                for node in serialized:
-                    if node["value"] == insert_value:
-                        new_node_id = node["id"]
-                        break
-                
-                # FRAME: Found NULL spot
-                frame = create_empty_frame(frame_id, f"🎯 Found NULL spot! Right child of {current.value} is empty - perfect place for {insert_value}!")
-                frame["trees"] = [{
+            # FRAME: Found NULL spot
+            yield create_empty_frame(
+                next(frame_ids), NULL_SPOT_DESC.format_map(step),
+                trees=[{
                     "name": "Binary Search Tree",
                     "nodes": serialized,
                     "highlights": {
                         "node_ids": [current_node_id],
-                        "colors": ["#e67e22"],
+                        "colors": [INSERTION_PARENT_COLOR],
                         "labels": ["INSERTION PARENT"]
                     }
                 }]
-                frames.append(frame)
-                frame_id += 1
-                
-                # FRAME: Actually insert
-                frame = create_empty_frame(frame_id, f"✨ INSERT! Creating new node with value {insert_value} as RIGHT CHILD of {current.value}")
-                frame["trees"] = [{
+            )
+            
+            # FRAME: Actually insert
+            yield create_empty_frame(
+                next(frame_ids), INSERT_DESC.format_map(step),
+                trees=[{
                     "name": "Binary Search Tree",
                     "nodes": serialized,
                     "highlights": {
                         "node_ids": [new_node_id, current_node_id],
-                        "colors": ["#2ecc71", "#3498db"],
+                        "colors": [INSERTED_COLOR, PARENT_COLOR],
                         "labels": ["INSERTED!", "PARENT"]
                     }
-                }]
-                frame["variables"] = [
+                }],
+                variables=[
                     {"name": "inserted_value", "value": str(insert_value), "type": "int"},
                     {"name": "parent_node", "value": str(current.value), "type": "int"},
-                    {"name": "position", "value": "RIGHT CHILD", "type": "string"},
+                    {"name": "position", "value": f"{direction['SIDE']} CHILD", "type": "string"},
                     {"name": "total_comparisons", "value": str(comparisons), "type": "int"}
                 ]
-                frames.append(frame)
-                frame_id += 1
-                
-                # FRAME: Verify BST property maintained
-                frame = create_empty_frame(frame_id, f"✅ Verify: {insert_value} > {current.value}? YES! BST property maintained")
-                frame["trees"] = [{
+            )
+            
+            # FRAME: Verify BST property maintained
+            yield create_empty_frame(
+                next(frame_ids), VERIFY_DESC.format_map(step),
+                trees=[{
                     "name": "Binary Search Tree",
                     "nodes": serialized,
                     "highlights": {
                         "node_ids": [new_node_id],
-                        "colors": ["#2ecc71"],
+                        "colors": [INSERTED_COLOR],
                         "labels": ["VALID POSITION"]
                     }
                 }]
-                frames.append(frame)
-                frame_id += 1
-                break
-            else:
-                # FRAME: Moving to right child
-                frame = create_empty_frame(frame_id, f"➡️ Moving to right child... Next node to check: {current.right.value}")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized
-                }]
-                frames.append(frame)
-                frame_id += 1
-                current = current.right
+            )
+            break
+        
+        # FRAME: Moving to child
+        yield create_empty_frame(
+            next(frame_ids), MOVE_DESC.format(child=child.value, **step),
+            trees=[{"name": "Binary Search Tree", "nodes": serialized}]
+        )
+        path_node_ids.append(current_node_id)
+        visited_colors.append(VISITED_COLOR)
+        visited_labels.append("VISITED")
+        current_node_id = serialized[current_node_id][direction["link"]]
+        current = child
     
     # FINAL FRAME: Complete tree with stats
-    frame = create_empty_frame(frame_id, f"🎉 Insertion Complete! Tree now has {len(tree_values) + 1} nodes. Path taken: {' → '.join(map(str, path_values))}")
-    frame["trees"] = [{
-        "name": "Final Binary Search Tree",
-        "nodes": serialize_tree(root)
-    }]
-    frame["variables"] = [
-        {"name": "total_nodes", "value": str(len(tree_values) + 1), "type": "int"},
-        {"name": "comparisons_made", "value": str(comparisons), "type": "int"},
-        {"name": "path_length", "value": str(len(path_values)), "type": "int"},
-        {"name": "status", "value": "SUCCESS ✅", "type": "string"}
-    ]
-    frames.append(frame)
-    frame_id += 1
+    yield create_empty_frame(
+        next(frame_ids), f"🎉 Insertion Complete! Tree now has {len(tree_values) + 1} nodes. Path taken: {path_text}",
+        trees=[{"name": "Final Binary Search Tree", "nodes": serialized}],
+        variables=[
+            {"name": "total_nodes", "value": str(len(tree_values) + 1), "type": "int"},
+            {"name": "comparisons_made", "value": str(comparisons), "type": "int"},
+            {"name": "path_length", "value": str(len(path_values)), "type": "int"},
+            STATUS_VAR
+        ]
+    )
     
     # BONUS FRAME: Time complexity explanation
-    frame = create_empty_frame(frame_id, f"⏱️ Time Complexity: O(h) where h = height of tree. In this case, we made {comparisons} comparisons (height = {len(path_values)})")
-    frame["trees"] = [{
-        "name": "Binary Search Tree",
-        "nodes": serialize_tree(root)
-    }]
-    frame["variables"] = [
-        {"name": "best_case", "value": "O(log n) - balanced tree", "type": "string"},
-        {"name": "worst_case", "value": "O(n) - skewed tree", "type": "string"},
-        {"name": "this_case", "value": f"O({len(path_values)})", "type": "string"}
-    ]
-    frames.append(frame)
-    
-    return frames
+    yield create_empty_frame(
+        next(frame_ids), f"⏱️ Time Complexity: O(h) where h = height of tree. In this case, we made {comparisons} comparisons (height = {len(path_values)})",
+        trees=[{"name": "Binary Search Tree", "nodes": serialized}],
+        variables=[
+            BEST_CASE_VAR,
+            WORST_CASE_VAR,
+            {"name": "this_case", "value": f"O({len(path_values)})", "type": "string"}
+        ]
+    )
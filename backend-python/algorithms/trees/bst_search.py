@@ -3,11 +3,13 @@ BST Search Algorithm - PRODUCTION GRADE with 15-20 frames
 Enhanced with educational content and detailed step-by-step visualization
 """
 
-from typing import List, Dict, Any
+from itertools import count
+from typing import Dict, Any, Iterator
 from .tree_utils import (
-    build_tree_from_array,
+    build_tree_shared,
     serialize_tree,
     create_empty_frame,
+    tree_ref,
     TreeNode
 )
 
@@ -24,271 +26,202 @@ METADATA = {
 }
 
 
-def execute(params: dict) -> List[Dict[str, Any]]:
+# Highlight colors
+START_COLOR = "#9b59b6"
+VISITED_COLOR = "#95a5a6"
+COMPARING_COLOR = "#f39c12"
+PARENT_COLOR = "#3498db"
+FOUND_COLOR = "#2ecc71"
+FAILED_COLOR = "#e74c3c"
+
+# Wording for each direction, keyed by `search_value < current.value`
+DIRECTIONS = {
+    True: {"side": "left", "Side": "Left", "SIDE": "LEFT", "symbol": "<",
+           "decision": "GO LEFT ←", "link": "left_child_id"},
+    False: {"side": "right", "Side": "Right", "SIDE": "RIGHT", "symbol": ">",
+            "decision": "GO RIGHT →", "link": "right_child_id"},
+}
+
+# Per-step descriptions, filled from a direction plus value/node/child
+COMPARE_DESC = "🔍 Compare: {value} {symbol} {node}? YES! Search in {SIDE} subtree"
+WHY_DESC = ("💡 WHY {side}? BST property: All {side} values {symbol} {node}. "
+            "Since {value} {symbol} {node}, it MUST be in {side} subtree (if it exists)")
+NULL_DESC = "🚫 Reached NULL! {Side} child of {node} doesn't exist. {value} NOT FOUND in tree"
+MOVE_DESC = "➡️ Moving to {side} child: {child}"
+
+
+def execute(params: dict) -> Iterator[Dict[str, Any]]:
     """Execute BST search with detailed 15-20 frame visualization"""
-    frames = []
-    frame_id = 0
+    frame_ids = count()
     
     tree_values = params.get('tree_values', [])
     search_value = params.get('search_value')
     
     if search_value is None:
         frame = create_empty_frame(0, "Error: No search value provided")
-        frames.append(frame)
-        return frames
+        yield frame
+        return
+    
+    # Same value in every frame - build once per call
+    search_var = {"name": "search_value", "value": str(search_value), "type": "int"}
     
-    root = build_tree_from_array(tree_values)
+    root = build_tree_shared(tree_values)  # read-only below
+    # Search never mutates the tree - serialize once, share across frames
+    serialized = serialize_tree(root)
     
     # FRAME 0: Introduction
-    frame = create_empty_frame(frame_id, "🔍 BST Search: Finding a value efficiently using Binary Search Tree properties")
+    frame = create_empty_frame(next(frame_ids), "🔍 BST Search: Finding a value efficiently using Binary Search Tree properties")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
+        # Node list ships once; every later frame points at it by tree_ref
+        frame["fixtures"] = {"tree": serialized}
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
     frame["variables"] = [
-        {"name": "search_value", "value": str(search_value), "type": "int"},
+        search_var,
         {"name": "rule", "value": "Left < Parent < Right", "type": "string"}
     ]
-    frames.append(frame)
-    frame_id += 1
+    yield frame
     
     # FRAME 1: Goal explanation
-    frame = create_empty_frame(frame_id, f"🎯 Goal: Find if value {search_value} exists in the BST. If found, return TRUE; otherwise FALSE")
+    frame = create_empty_frame(next(frame_ids), f"🎯 Goal: Find if value {search_value} exists in the BST. If found, return TRUE; otherwise FALSE")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
     frame["variables"] = [
-        {"name": "search_value", "value": str(search_value), "type": "int"},
+        search_var,
         {"name": "total_nodes", "value": str(len(tree_values)), "type": "int"}
     ]
-    frames.append(frame)
-    frame_id += 1
+    yield frame
     
     # FRAME 2: Strategy
-    frame = create_empty_frame(frame_id, "🧭 Strategy: Start at root. If value < current, go LEFT. If value > current, go RIGHT. Until found or NULL")
+    frame = create_empty_frame(next(frame_ids), "🧭 Strategy: Start at root. If value < current, go LEFT. If value > current, go RIGHT. Until found or NULL")
     if root:
-        serialized = serialize_tree(root)
-        frame["trees"] = [{
-            "name": "Binary Search Tree",
-            "nodes": serialized,
-            "highlights": {
-                "node_ids": [0],
-                "colors": ["#9b59b6"],
-                "labels": ["START"]
-            }
-        }]
-    frames.append(frame)
-    frame_id += 1
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+            "node_ids": [0],
+            "colors": [START_COLOR],
+            "labels": ["START"]
+        })]
+    yield frame
     
     if not root:
-        frame = create_empty_frame(frame_id, "Tree is empty! Search failed.")
-        frames.append(frame)
-        return frames
+        frame = create_empty_frame(next(frame_ids), "Tree is empty! Search failed.")
+        yield frame
+        return
     
     # Perform search
+    plain_tree = [tree_ref("Binary Search Tree", "tree")]  # shared by every "moving" frame
     current = root
     found = False
     comparisons = 0
     path_values = []
+    path_node_ids = []
+    current_node_id = 0  # follows current through the child links
     
     while current:
         comparisons += 1
-        serialized = serialize_tree(root)
-        
-        # Find IDs
-        current_node_id = None
-        path_node_ids = []
-        for node in serialized:
-            if node["value"] == current.value:
-                current_node_id = node["id"]
-            if node["value"] in path_values:
-                path_node_ids.append(node["id"])
-        
+        comparisons_str = str(comparisons)  # shown by several frames of this step
         path_values.append(current.value)
         
         # Check if found
         if current.value == search_value:
             # FRAME: Found match!
-            frame = create_empty_frame(frame_id, f"✅ MATCH! Current node {current.value} == {search_value}. Value FOUND!")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": [current_node_id],
-                    "colors": ["#2ecc71"],
-                    "labels": ["FOUND!"]
-                }
-            }]
+            frame = create_empty_frame(next(frame_ids), f"✅ MATCH! Current node {current.value} == {search_value}. Value FOUND!")
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+                "node_ids": [current_node_id],
+                "colors": [FOUND_COLOR],
+                "labels": ["FOUND!"]
+            })]
             frame["variables"] = [
-                {"name": "search_value", "value": str(search_value), "type": "int"},
+                search_var,
                 {"name": "current_node", "value": str(current.value), "type": "int"},
                 {"name": "status", "value": "FOUND ✅", "type": "string"},
-                {"name": "comparisons", "value": str(comparisons), "type": "int"}
+                {"name": "comparisons", "value": comparisons_str, "type": "int"}
             ]
-            frames.append(frame)
-            frame_id += 1
+            yield frame
             
             # FRAME: Success confirmation
-            frame = create_empty_frame(frame_id, f"🎉 Success! Found {search_value} in the BST after {comparisons} comparisons")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": path_node_ids + [current_node_id],
-                    "colors": ["#95a5a6"] * len(path_node_ids) + ["#2ecc71"],
-                    "labels": ["VISITED"] * len(path_node_ids) + ["TARGET"]
-                }
-            }]
+            frame = create_empty_frame(next(frame_ids), f"🎉 Success! Found {search_value} in the BST after {comparisons} comparisons")
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+                "node_ids": path_node_ids + [current_node_id],
+                "colors": [VISITED_COLOR] * len(path_node_ids) + [FOUND_COLOR],
+                "labels": ["VISITED"] * len(path_node_ids) + ["TARGET"]
+            })]
             frame["variables"] = [
                 {"name": "result", "value": "TRUE", "type": "boolean"},
                 {"name": "path_taken", "value": " → ".join(map(str, path_values)), "type": "string"}
             ]
-            frames.append(frame)
+            yield frame
             found = True
             break
         
-        # Comparison frames
-        elif search_value < current.value:
-            # FRAME: Comparison - go left
-            frame = create_empty_frame(frame_id, f"🔍 Compare: {search_value} < {current.value}? YES! Search in LEFT subtree")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": path_node_ids + [current_node_id],
-                    "colors": ["#95a5a6"] * len(path_node_ids) + ["#f39c12"],
-                    "labels": ["VISITED"] * len(path_node_ids) + ["COMPARING"]
-                }
-            }]
-            frame["variables"] = [
-                {"name": "search_value", "value": str(search_value), "type": "int"},
-                {"name": "current_node", "value": str(current.value), "type": "int"},
-                {"name": "comparison", "value": f"{search_value} < {current.value}", "type": "string"},
-                {"name": "decision", "value": "GO LEFT ←", "type": "string"},
-                {"name": "comparisons", "value": str(comparisons), "type": "int"}
-            ]
-            frames.append(frame)
-            frame_id += 1
-            
-            # FRAME: Why go left
-            frame = create_empty_frame(frame_id, f"💡 WHY left? BST property: All left values < {current.value}. Since {search_value} < {current.value}, it MUST be in left subtree (if it exists)")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": [current_node_id],
-                    "colors": ["#3498db"],
-                    "labels": ["PARENT"]
-                }
-            }]
-            frames.append(frame)
-            frame_id += 1
-            
-            if current.left is None:
-                # FRAME: Reached NULL
-                frame = create_empty_frame(frame_id, f"🚫 Reached NULL! Left child of {current.value} doesn't exist. {search_value} NOT FOUND in tree")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized,
-                    "highlights": {
-                        "node_ids": path_node_ids + [current_node_id],
-                        "colors": ["#e74c3c"] * (len(path_node_ids) + 1),
-                        "labels": ["FAILED PATH"] * (len(path_node_ids) + 1)
-                    }
-                }]
-                frame["variables"] = [
-                    {"name": "result", "value": "FALSE", "type": "boolean"},
-                    {"name": "comparisons", "value": str(comparisons), "type": "int"}
-                ]
-                frames.append(frame)
-                break
-            
-            # FRAME: Moving left
-            frame = create_empty_frame(frame_id, f"➡️ Moving to left child: {current.left.value}")
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized}]
-            frames.append(frame)
-            frame_id += 1
-            current = current.left
-            
-        else:  # search_value > current.value
-            # FRAME: Comparison - go right
-            frame = create_empty_frame(frame_id, f"🔍 Compare: {search_value} > {current.value}? YES! Search in RIGHT subtree")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": path_node_ids + [current_node_id],
-                    "colors": ["#95a5a6"] * len(path_node_ids) + ["#f39c12"],
-                    "labels": ["VISITED"] * len(path_node_ids) + ["COMPARING"]
-                }
-            }]
+        # Comparison frames - one path for both directions
+        direction = DIRECTIONS[search_value < current.value]
+        step = {**direction, "value": search_value, "node": current.value}
+        
+        # FRAME: Comparison
+        frame = create_empty_frame(next(frame_ids), COMPARE_DESC.format_map(step))
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+            "node_ids": path_node_ids + [current_node_id],
+            "colors": [VISITED_COLOR] * len(path_node_ids) + [COMPARING_COLOR],
+            "labels": ["VISITED"] * len(path_node_ids) + ["COMPARING"]
+        })]
+        frame["variables"] = [
+            search_var,
+            {"name": "current_node", "value": str(current.value), "type": "int"},
+            {"name": "comparison", "value": f"{search_value} {direction['symbol']} {current.value}", "type": "string"},
+            {"name": "decision", "value": direction["decision"], "type": "string"},
+            {"name": "comparisons", "value": comparisons_str, "type": "int"}
+        ]
+        yield frame
+        
+        # FRAME: Why this direction
+        frame = create_empty_frame(next(frame_ids), WHY_DESC.format_map(step))
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+            "node_ids": [current_node_id],
+            "colors": [PARENT_COLOR],
+            "labels": ["PARENT"]
+        })]
+        yield frame
+        
+        child = getattr(current, direction["side"])
+        if child is None:
+            # FRAME: Reached NULL
+            frame = create_empty_frame(next(frame_ids), NULL_DESC.format_map(step))
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+                "node_ids": path_node_ids + [current_node_id],
+                "colors": [FAILED_COLOR] * (len(path_node_ids) + 1),
+                "labels": ["FAILED PATH"] * (len(path_node_ids) + 1)
+            })]
             frame["variables"] = [
-                {"name": "search_value", "value": str(search_value), "type": "int"},
-                {"name": "current_node", "value": str(current.value), "type": "int"},
-                {"name": "comparison", "value": f"{search_value} > {current.value}", "type": "string"},
-                {"name": "decision", "value": "GO RIGHT →", "type": "string"},
-                {"name": "comparisons", "value": str(comparisons), "type": "int"}
+                {"name": "result", "value": "FALSE", "type": "boolean"},
+                {"name": "comparisons", "value": comparisons_str, "type": "int"}
             ]
-            frames.append(frame)
-            frame_id += 1
-            
-            # FRAME: Why go right
-            frame = create_empty_frame(frame_id, f"💡 WHY right? BST property: All right values > {current.value}. Since {search_value} > {current.value}, it MUST be in right subtree (if it exists)")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": [current_node_id],
-                    "colors": ["#3498db"],
-                    "labels": ["PARENT"]
-                }
-            }]
-            frames.append(frame)
-            frame_id += 1
-            
-            if current.right is None:
-                # FRAME: Reached NULL
-                frame = create_empty_frame(frame_id, f"🚫 Reached NULL! Right child of {current.value} doesn't exist. {search_value} NOT FOUND in tree")
-                frame["trees"] = [{
-                    "name": "Binary Search Tree",
-                    "nodes": serialized,
-                    "highlights": {
-                        "node_ids": path_node_ids + [current_node_id],
-                        "colors": ["#e74c3c"] * (len(path_node_ids) + 1),
-                        "labels": ["FAILED PATH"] * (len(path_node_ids) + 1)
-                    }
-                }]
-                frame["variables"] = [
-                    {"name": "result", "value": "FALSE", "type": "boolean"},
-                    {"name": "comparisons", "value": str(comparisons), "type": "int"}
-                ]
-                frames.append(frame)
-                break
-            
-            # FRAME: Moving right
-            frame = create_empty_frame(frame_id, f"➡️ Moving to right child: {current.right.value}")
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized}]
-            frames.append(frame)
-            frame_id += 1
-            current = current.right
+            yield frame
+            break
+        
+        # FRAME: Moving to the child
+        frame = create_empty_frame(next(frame_ids), MOVE_DESC.format(child=child.value, **step))
+        frame["trees"] = plain_tree
+        yield frame
+        path_node_ids.append(current_node_id)
+        current_node_id = serialized[current_node_id][direction["link"]]
+        current = child
     
     # FINAL FRAME: Summary
     result_text = "FOUND ✅" if found else "NOT FOUND ❌"
-    frame = create_empty_frame(frame_id, f"🏁 Search Complete! Result: {search_value} was {result_text}. Path: {' → '.join(map(str, path_values))}")
-    frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
+    frame = create_empty_frame(next(frame_ids), f"🏁 Search Complete! Result: {search_value} was {result_text}. Path: {' → '.join(map(str, path_values))}")
+    frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
     frame["variables"] = [
-        {"name": "search_value", "value": str(search_value), "type": "int"},
+        search_var,
         {"name": "result", "value": "TRUE" if found else "FALSE", "type": "boolean"},
-        {"name": "total_comparisons", "value": str(comparisons), "type": "int"},
+        {"name": "total_comparisons", "value": comparisons_str, "type": "int"},
         {"name": "path_length", "value": str(len(path_values)), "type": "int"}
     ]
-    frames.append(frame)
-    frame_id += 1
+    yield frame
     
     # BONUS FRAME: Complexity
-    frame = create_empty_frame(frame_id, f"⏱️ Time Complexity: O(h) = O({len(path_values)}). Best: O(log n) balanced, Worst: O(n) skewed")
-    frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
+    frame = create_empty_frame(next(frame_ids), f"⏱️ Time Complexity: O(h) = O({len(path_values)}). Best: O(log n) balanced, Worst: O(n) skewed")
+    frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
     frame["variables"] = [
-        {"name": "comparisons_made", "value": str(comparisons), "type": "int"},
+        {"name": "comparisons_made", "value": comparisons_str, "type": "int"},
         {"name": "efficiency", "value": f"Checked {comparisons}/{len(tree_values)} nodes", "type": "string"}
     ]
-    frames.append(frame)
-    
-    return frames
+    yield frame
@@ -0,0 +1,48 @@
+#include <bits/stdc++.h>
+using namespace std;
+
+struct Node {
+    int data;
+    Node *left, *right;
+    Node(int val) : data(val), left(NULL), right(NULL) {}
+};
+
+void inorder(Node* root) {
+    if (!root) return;
+    inorder(root->left);
+    cout << root->data << " ";
+    inorder(root->right);
+}
+
+void preorder(Node* root) {
+    if (!root) return;
+    cout << root->data << " ";
+    preorder(root->left);
+    preorder(root->right);
+}
+
+void postorder(Node* root) {
+    if (!root) return;
+    postorder(root->left);
+    postorder(root->right);
+    cout << root->data << " ";
+}
+
+int main() {
+    vector<int> tree_values = {50, 30, 70, 20, 40, 60, 80};
+    // Build BST from values
+    
+    cout << "Inorder: ";
+    // inorder(root);
+    cout << endl;
+    
+    cout << "Preorder: ";
+    // preorder(root);
+    cout << endl;
+    
+    cout << "Postorder: ";
+    // postorder(root);
+    cout << endl;
+    
+    return 0;
+}
\ No newline at end of file
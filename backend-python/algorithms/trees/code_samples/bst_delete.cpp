@@ -0,0 +1,43 @@
+#include <bits/stdc++.h>
+using namespace std;
+
+struct Node {
+    int data;
+    Node *left, *right;
+    Node(int val) : data(val), left(NULL), right(NULL) {}
+};
+
+Node* minValueNode(Node* node) {
+    while (node->left) node = node->left;
+    return node;
+}
+
+Node* deleteNode(Node* root, int val) {
+    if (!root) return NULL;
+    
+    if (val < root->data)
+        root->left = deleteNode(root->left, val);
+    else if (val > root->data)
+        root->right = deleteNode(root->right, val);
+    else {
+        // Node found - delete it
+        if (!root->left) return root->right;
+        if (!root->right) return root->left;
+        
+        // Node with two children
+        Node* temp = minValueNode(root->right);
+        root->data = temp->data;
+        root->right = deleteNode(root->right, temp->data);
+    }
+    return root;
+}
+
+int main() {
+    vector<int> tree_values = {50, 30, 70, 20, 40, 60, 80};
+    // Build BST from values
+    
+    int delete_value = 30;
+    // Delete node
+    
+    return 0;
+}
\ No newline at end of file
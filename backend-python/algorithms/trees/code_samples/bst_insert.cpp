@@ -0,0 +1,45 @@
+#include <bits/stdc++.h>
+using namespace std;
+
+struct Node {
+    int data;
+    Node *left, *right;
+    Node(int val) : data(val), left(NULL), right(NULL) {}
+};
+
+class TrackedTree {
+public:
+    Node* root;
+    
+    TrackedTree() : root(NULL) {}
+    
+    Node* insert(Node* node, int val) {
+        if (!node) return new Node(val);
+        
+        if (val < node->data)
+            node->left = insert(node->left, val);
+        else if (val > node->data)
+            node->right = insert(node->right, val);
+        
+        return node;
+    }
+    
+    void insertValue(int val) {
+        root = insert(root, val);
+    }
+};
+
+int main() {
+    vector<int> tree_values = {50, 30, 70, 20, 40, 60, 80};
+    TrackedTree tree;
+    
+    for (int val : tree_values) {
+        tree.insertValue(val);
+    }
+    
+    // Insert new value
+    int insert_value = 45;
+    tree.insertValue(insert_value);
+    
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,43 @@
+#include <bits/stdc++.h>
+using namespace std;
+
+struct Node {
+    int data;
+    Node *left, *right;
+    Node(int val) : data(val), left(NULL), right(NULL) {}
+};
+
+class TrackedTree {
+public:
+    Node* root;
+    
+    TrackedTree() : root(NULL) {}
+    
+    bool search(Node* node, int val) {
+        if (!node) return false;
+        if (node->data == val) return true;
+        
+        if (val < node->data)
+            return search(node->left, val);
+        else
+            return search(node->right, val);
+    }
+    
+    bool searchValue(int val) {
+        return search(root, val);
+    }
+};
+
+int main() {
+    vector<int> tree_values = {50, 30, 70, 20, 40, 60, 80};
+    TrackedTree tree;
+    
+    // Build tree (simplified)
+    // tree.root = buildTree(tree_values);
+    
+    int search_value = 40;
+    bool found = tree.searchValue(search_value);
+    
+    cout << (found ? "Found" : "Not found") << endl;
+    return 0;
+}
\ No newline at end of file
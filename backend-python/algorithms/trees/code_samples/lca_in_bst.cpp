@@ -0,0 +1,35 @@
+#include <bits/stdc++.h>
+using namespace std;
+
+struct Node {
+    int data;
+    Node *left, *right;
+    Node(int val) : data(val), left(NULL), right(NULL) {}
+};
+
+Node* LCA(Node* root, int n1, int n2) {
+    if (!root) return NULL;
+    
+    // Both nodes in left subtree
+    if (root->data > n1 && root->data > n2)
+        return LCA(root->left, n1, n2);
+    
+    // Both nodes in right subtree
+    if (root->data < n1 && root->data < n2)
+        return LCA(root->right, n1, n2);
+    
+    // Split point - this is LCA
+    return root;
+}
+
+int main() {
+    vector<int> tree_values = {50, 30, 70, 20, 40, 60, 80};
+    // Build BST from values
+    
+    int node1 = 20, node2 = 60;
+    // Node* lca = LCA(root, node1, node2);
+    
+    // cout << "LCA: " << lca->data << endl;
+    
+    return 0;
+}
\ No newline at end of file
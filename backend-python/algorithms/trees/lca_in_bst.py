@@ -1,8 +1,9 @@
 """
 LCA in BST - Enhanced with 15+ production-grade frames
 """
-from typing import List, Dict, Any
-from .tree_utils import build_tree_from_array, serialize_tree, create_empty_frame, TreeNode
+from itertools import count
+from typing import Dict, Any, Iterator
+from .tree_utils import build_tree_shared, serialize_tree, create_empty_frame, find_node, build_value_index, tree_ref, TreeNode
 
 METADATA = {
     "name": "LCA in BST",
@@ -16,72 +17,81 @@ METADATA = {
     }
 }
 
-def execute(params: dict) -> List[Dict[str, Any]]:
-    frames, frame_id = [], 0
+# Highlight colors
+TARGET1_COLOR = "#f39c12"
+TARGET2_COLOR = "#9b59b6"
+CURRENT_COLOR = "#3498db"
+MOVE_COLOR = "#f39c12"
+LCA_COLOR = "#f1c40f"
+TARGET_COLOR = "#e74c3c"
+FOUND_COLOR = "#2ecc71"
+
+# Wording for each direction, keyed by "both nodes are smaller"
+DIRECTIONS = {
+    True: {"side": "left", "SIDE": "LEFT", "arrow": "⬅️", "symbol": "<", "label": "GO LEFT"},
+    False: {"side": "right", "SIDE": "RIGHT", "arrow": "➡️", "symbol": ">", "label": "GO RIGHT"},
+}
+MOVE_DESC = "{arrow} Both {node1} and {node2} {symbol} {node} → Both are in {SIDE} subtree, move {side}"
+
+def execute(params: dict) -> Iterator[Dict[str, Any]]:
+    frame_ids = count()
     tree_values = params.get('tree_values', [])
     node1, node2 = params.get('node1'), params.get('node2')
     
     if node1 is None or node2 is None:
-        frames.append(create_empty_frame(0, "Error: Two node values required for LCA"))
-        return frames
+        yield create_empty_frame(0, "Error: Two node values required for LCA")
+        return
     
-    root = build_tree_from_array(tree_values)
+    # Same values in every frame - build once per call
+    node1_var = {"name": "node1", "value": str(node1), "type": "int"}
+    node2_var = {"name": "node2", "value": str(node2), "type": "int"}
+    
+    root = build_tree_shared(tree_values)  # read-only below
+    # The tree never changes - serialize once, share across frames
+    serialized = serialize_tree(root)
+    value_to_id = build_value_index(serialized)
     
     # Frame 0: Intro
-    frame = create_empty_frame(frame_id, "🔍 Lowest Common Ancestor (LCA): Find the deepest node that is ancestor of BOTH given nodes")
+    frame = create_empty_frame(next(frame_ids), "🔍 Lowest Common Ancestor (LCA): Find the deepest node that is ancestor of BOTH given nodes")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frame["variables"] = [{"name": "node1", "value": str(node1), "type": "int"},
-                          {"name": "node2", "value": str(node2), "type": "int"}]
-    frames.append(frame)
-    frame_id += 1
+        # Node list ships once; every later frame points at it by tree_ref
+        frame["fixtures"] = {"tree": serialized}
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
+    frame["variables"] = [node1_var, node2_var]
+    yield frame
     
     # Frame 1: What is an ancestor?
-    frame = create_empty_frame(frame_id, "📚 Ancestor: A node is ancestor of another if it lies on the path from root to that node")
+    frame = create_empty_frame(next(frame_ids), "📚 Ancestor: A node is ancestor of another if it lies on the path from root to that node")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
-    frame_id += 1
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
+    yield frame
     
     # Frame 2: Goal
-    frame = create_empty_frame(frame_id, f"🎯 Find LCA of {node1} and {node2}: The split point where paths to both nodes diverge")
+    frame = create_empty_frame(next(frame_ids), f"🎯 Find LCA of {node1} and {node2}: The split point where paths to both nodes diverge")
     if root:
-        serialized = serialize_tree(root)
         # Highlight both target nodes
         ids = [n["id"] for n in serialized if n["value"] in [node1, node2]]
         if len(ids) == 2:
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {"node_ids": ids, "colors": ["#f39c12", "#9b59b6"], "labels": ["TARGET 1", "TARGET 2"]}
-            }]
-    frames.append(frame)
-    frame_id += 1
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree",
+                                       {"node_ids": ids, "colors": [TARGET1_COLOR, TARGET2_COLOR], "labels": ["TARGET 1", "TARGET 2"]})]
+    yield frame
     
     # Frame 3: Strategy
-    frame = create_empty_frame(frame_id, "🧭 BST Strategy: If both nodes < current, LCA in LEFT. If both > current, LCA in RIGHT. Else, current IS LCA!")
+    frame = create_empty_frame(next(frame_ids), "🧭 BST Strategy: If both nodes < current, LCA in LEFT. If both > current, LCA in RIGHT. Else, current IS LCA!")
     if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
-    frame_id += 1
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree")]
+    yield frame
     
     if not root:
-        frame = create_empty_frame(frame_id, "Empty tree - no LCA")
-        frames.append(frame)
-        return frames
+        frame = create_empty_frame(next(frame_ids), "Empty tree - no LCA")
+        yield frame
+        return
     
-    # Verify nodes exist
-    def find_node(node, value):
-        if not node:
-            return False
-        if node.value == value:
-            return True
-        return find_node(node.left, value) or find_node(node.right, value)
-    
-    if not find_node(root, node1) or not find_node(root, node2):
-        frame = create_empty_frame(frame_id, f"❌ One or both nodes not found in tree")
-        frames.append(frame)
-        return frames
+    # Verify nodes exist - BST descent, O(h) each
+    if find_node(root, node1) is None or find_node(root, node2) is None:
+        frame = create_empty_frame(next(frame_ids), f"❌ One or both nodes not found in tree")
+        yield frame
+        return
     
     # Find LCA
     current = root
@@ -89,89 +99,61 @@ def execute(params: dict) -> List[Dict[str, Any]]:
     
     while current:
         path.append(current.value)
-        serialized = serialize_tree(root)
-        node_id = next((n["id"] for n in serialized if n["value"] == current.value), None)
+        node_id = value_to_id[current.value]
         
         # Frame: Current position
-        frame = create_empty_frame(frame_id, f"📍 At node {current.value}: Checking where {node1} and {node2} are relative to this node")
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                          "highlights": {"node_ids": [node_id], "colors": ["#3498db"], "labels": ["CURRENT"]}}]
-        frame["variables"] = [{"name": "node1", "value": str(node1), "type": "int"},
-                              {"name": "node2", "value": str(node2), "type": "int"},
+        frame = create_empty_frame(next(frame_ids), f"📍 At node {current.value}: Checking where {node1} and {node2} are relative to this node")
+        frame["trees"] = [tree_ref("Binary Search Tree", "tree",
+                                   {"node_ids": [node_id], "colors": [CURRENT_COLOR], "labels": ["CURRENT"]})]
+        frame["variables"] = [node1_var, node2_var,
                               {"name": "current", "value": str(current.value), "type": "int"}]
-        frames.append(frame)
-        frame_id += 1
+        yield frame
         
-        if node1 < current.value and node2 < current.value:
-            # Both in left subtree
-            frame = create_empty_frame(frame_id, f"⬅️ Both {node1} and {node2} < {current.value} → Both are in LEFT subtree, move left")
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                              "highlights": {"node_ids": [node_id], "colors": ["#f39c12"], "labels": ["GO LEFT"]}}]
-            frames.append(frame)
-            frame_id += 1
-            current = current.left
-            
-        elif node1 > current.value and node2 > current.value:
-            # Both in right subtree
-            frame = create_empty_frame(frame_id, f"➡️ Both {node1} and {node2} > {current.value} → Both are in RIGHT subtree, move right")
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized,
-                              "highlights": {"node_ids": [node_id], "colors": ["#f39c12"], "labels": ["GO RIGHT"]}}]
-            frames.append(frame)
-            frame_id += 1
-            current = current.right
+        goes_left = node1 < current.value and node2 < current.value
+        if goes_left or (node1 > current.value and node2 > current.value):
+            # Both in the same subtree - one path for both directions
+            direction = DIRECTIONS[goes_left]
+            frame = create_empty_frame(next(frame_ids), MOVE_DESC.format(node1=node1, node2=node2, node=current.value, **direction))
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree",
+                                       {"node_ids": [node_id], "colors": [MOVE_COLOR], "labels": [direction["label"]]})]
+            yield frame
+            current = getattr(current, direction["side"])
             
         else:
             # Split point - this is LCA!
-            frame = create_empty_frame(frame_id, f"⭐ SPLIT POINT! {node1} and {node2} are on OPPOSITE sides (or one equals current)")
-            serialized = serialize_tree(root)
-            lca_id = next((n["id"] for n in serialized if n["value"] == current.value), None)
+            frame = create_empty_frame(next(frame_ids), f"⭐ SPLIT POINT! {node1} and {node2} are on OPPOSITE sides (or one equals current)")
+            lca_id = node_id
             target_ids = [n["id"] for n in serialized if n["value"] in [node1, node2]]
             
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {
-                    "node_ids": [lca_id] + target_ids,
-                    "colors": ["#f1c40f"] + ["#e74c3c"] * len(target_ids),
-                    "labels": ["LCA ⭐"] + ["TARGET"] * len(target_ids)
-                }
-            }]
-            frames.append(frame)
-            frame_id += 1
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree", {
+                "node_ids": [lca_id] + target_ids,
+                "colors": [LCA_COLOR] + [TARGET_COLOR] * len(target_ids),
+                "labels": ["LCA ⭐"] + ["TARGET"] * len(target_ids)
+            })]
+            yield frame
             
             # Explanation why
-            frame = create_empty_frame(frame_id, f"💡 WHY is {current.value} the LCA? It's the deepest node where paths to {node1} and {node2} split")
-            frame["trees"] = [{
-                "name": "Binary Search Tree",
-                "nodes": serialized,
-                "highlights": {"node_ids": [lca_id], "colors": ["#f1c40f"], "labels": ["LCA"]}
-            }]
-            frames.append(frame)
-            frame_id += 1
+            frame = create_empty_frame(next(frame_ids), f"💡 WHY is {current.value} the LCA? It's the deepest node where paths to {node1} and {node2} split")
+            frame["trees"] = [tree_ref("Binary Search Tree", "tree",
+                                       {"node_ids": [lca_id], "colors": [LCA_COLOR], "labels": ["LCA"]})]
+            yield frame
             break
     
     # Final summary
-    frame = create_empty_frame(frame_id, f"✅ LCA Found! The Lowest Common Ancestor of {node1} and {node2} is {current.value}")
-    serialized = serialize_tree(root)
-    lca_id = next((n["id"] for n in serialized if n["value"] == current.value), None)
-    frame["trees"] = [{
-        "name": "Binary Search Tree",
-        "nodes": serialized,
-        "highlights": {"node_ids": [lca_id], "colors": ["#2ecc71"], "labels": ["LCA ✓"]}
-    }]
+    frame = create_empty_frame(next(frame_ids), f"✅ LCA Found! The Lowest Common Ancestor of {node1} and {node2} is {current.value}")
+    lca_id = value_to_id[current.value]
+    frame["trees"] = [tree_ref("Binary Search Tree", "tree",
+                               {"node_ids": [lca_id], "colors": [FOUND_COLOR], "labels": ["LCA ✓"]})]
     frame["variables"] = [
         {"name": "lca", "value": str(current.value), "type": "int"},
         {"name": "path_taken", "value": " → ".join(map(str, path)), "type": "string"}
     ]
-    frames.append(frame)
-    frame_id += 1
+    yield frame
     
     # Complexity
-    frame = create_empty_frame(frame_id, f"⏱️ Time Complexity: O(h) where h={len(path)} (height of tree). Visited {len(path)} nodes")
+    frame = create_empty_frame(next(frame_ids), f"⏱️ Time Complexity: O(h) where h={len(path)} (height of tree). Visited {len(path)} nodes")
     frame["variables"] = [
         {"name": "comparisons", "value": str(len(path)), "type": "int"},
         {"name": "efficiency", "value": f"{len(path)}/{len(tree_values)} nodes checked", "type": "string"}
     ]
-    frames.append(frame)
-    
-    return frames
+    yield frame
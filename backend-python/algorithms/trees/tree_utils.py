@@ -3,12 +3,25 @@ Utility functions for tree algorithms
 Handles tree construction, serialization, and position calculation
 """
 
-from typing import List, Dict, Any, Optional
+from collections import deque
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import math
 
+# Distinct input trees kept as clone templates
+TREE_CACHE_SIZE = 128
+
+# Layout, in SVG units: horizontal slot per leaf, vertical gap per level
+LEAF_WIDTH = 80
+LEVEL_HEIGHT = 80
+TOP_MARGIN = 50
+
 
 class TreeNode:
     """Binary tree node"""
+    # Fixed layout: no per-node __dict__, cheaper value/left/right access
+    __slots__ = ("value", "left", "right")
+    
     def __init__(self, value):
         self.value = value
         self.left = None
@@ -31,11 +44,11 @@ def build_tree_from_array(values: List[Optional[int]]) -> Optional[TreeNode]:
         return None
     
     root = TreeNode(values[0])
-    queue = [root]
+    queue = deque([root])
     i = 1
     
     while queue and i < len(values):
-        node = queue.pop(0)
+        node = queue.popleft()
         
         # Left child
         if i < len(values) and values[i] is not None:
@@ -52,6 +65,72 @@ def build_tree_from_array(values: List[Optional[int]]) -> Optional[TreeNode]:
     return root
 
 
+@lru_cache(maxsize=TREE_CACHE_SIZE)
+def tree_template(values: tuple, types: tuple) -> tuple:
+    """
+    Cached flat form of build_tree_from_array(values): level-order rows of
+    (value, left_index, right_index), -1 for a missing child.
+    types keeps e.g. 1 and 1.0 (equal hashes) from sharing an entry.
+    """
+    root = build_tree_from_array(list(values))
+    if not root:
+        return ()
+    
+    order = [root]
+    index = {id(root): 0}
+    for node in order:  # order grows while we walk it - a BFS without a queue
+        for child in (node.left, node.right):
+            if child:
+                index[id(child)] = len(order)
+                order.append(child)
+    return tuple((node.value,
+                  index[id(node.left)] if node.left else -1,
+                  index[id(node.right)] if node.right else -1) for node in order)
+
+
+def clone_tree(template: tuple) -> Optional[TreeNode]:
+    """Fresh TreeNodes from a tree_template() - safe to mutate"""
+    if not template:
+        return None
+    nodes = [TreeNode(value) for value, _, _ in template]
+    for node, (_, left, right) in zip(nodes, template):
+        if left >= 0:
+            node.left = nodes[left]
+        if right >= 0:
+            node.right = nodes[right]
+    return nodes[0]
+
+
+def build_tree_cached(values: List[Optional[int]]) -> Optional[TreeNode]:
+    """
+    Same tree as build_tree_from_array(values), cloned from a cached template
+    so repeated inputs (e.g. the default tree) skip rebuilding from the array.
+    """
+    try:
+        values = tuple(values)
+        template = tree_template(values, tuple(map(type, values)))
+    except TypeError:  # None or unhashable entries - build directly
+        return build_tree_from_array(values)
+    return clone_tree(template)
+
+
+@lru_cache(maxsize=TREE_CACHE_SIZE)
+def _shared_tree(values: tuple, types: tuple) -> Optional[TreeNode]:
+    return clone_tree(tree_template(values, types))
+
+
+def build_tree_shared(values: List[Optional[int]]) -> Optional[TreeNode]:
+    """
+    Same tree as build_tree_cached(values), for callers that never mutate it:
+    repeated inputs get the very same cached nodes back, with no cloning.
+    """
+    try:
+        values = tuple(values)
+        return _shared_tree(values, tuple(map(type, values)))
+    except TypeError:  # None or unhashable entries - build directly
+        return build_tree_from_array(values)
+
+
 def serialize_tree(root: Optional[TreeNode]) -> List[Dict[str, Any]]:
     """
     Convert tree to array of nodes for visualization.
@@ -66,100 +145,156 @@ def serialize_tree(root: Optional[TreeNode]) -> List[Dict[str, Any]]:
     if not root:
         return []
     
-    nodes = []
-    node_id_map = {}
+    # Explicit stack instead of recursion - a skewed tree is as deep as it is
+    # long, and would hit the interpreter's recursion limit.
+    # Values and links go into flat lists; the dicts are built once at the end.
+    values, lefts, rights = [], [], []
+    stack = [(root, None, None)]
     
-    def assign_ids(node: TreeNode, current_id: int = 0) -> int:
-        """Recursively assign IDs to all nodes"""
-        if not node:
-            return current_id
-        
-        node_id_map[id(node)] = current_id
-        nodes.append({
-            "id": current_id,
-            "value": node.value,
-            "left_child_id": None,
-            "right_child_id": None,
-            "x": 0,
-            "y": 0
-        })
-        
-        next_id = current_id + 1
-        
-        if node.left:
-            nodes[current_id]["left_child_id"] = next_id
-            next_id = assign_ids(node.left, next_id)
+    while stack:
+        node, parent_id, links = stack.pop()
+        node_id = len(values)  # pre-order ids, same as the recursive walk gave
+        values.append(node.value)
+        lefts.append(None)
+        rights.append(None)
+        if parent_id is not None:
+            links[parent_id] = node_id
         
+        # Right pushed first so the left subtree is numbered first
         if node.right:
-            nodes[current_id]["right_child_id"] = next_id
-            next_id = assign_ids(node.right, next_id)
-        
-        return next_id
-    
-    assign_ids(root)
-    calculate_positions(nodes)
+            stack.append((node.right, node_id, rights))
+        if node.left:
+            stack.append((node.left, node_id, lefts))
     
-    return nodes
+    xs, ys = _layout(lefts, rights)
+    return [{
+        "id": node_id,
+        "value": value,
+        "left_child_id": left,
+        "right_child_id": right,
+        "x": x,
+        "y": y
+    } for node_id, (value, left, right, x, y) in enumerate(zip(values, lefts, rights, xs, ys))]
+
+
+def attach_child(nodes: List[Dict[str, Any]], parent_id: int, side: str, value) -> List[Dict[str, Any]]:
+    """
+    serialize_tree() output after giving node parent_id a new `side`
+    ("left"/"right") child, without re-walking the tree. The new node takes
+    the next free id, so existing ids stay stable. Returns a new list of
+    copied dicts - earlier snapshots that frames still reference are untouched.
+    """
+    new_id = len(nodes)
+    patched = [dict(node) for node in nodes]
+    patched[parent_id][f"{side}_child_id"] = new_id
+    patched.append({
+        "id": new_id,
+        "value": value,
+        "left_child_id": None,
+        "right_child_id": None,
+        "x": 0,
+        "y": 0
+    })
+    calculate_positions(patched)  # a deeper tree widens the whole layout
+    return patched
+
+
+def replace_value(nodes: List[Dict[str, Any]], node_id: int, value) -> List[Dict[str, Any]]:
+    """
+    serialize_tree() output after node node_id's value changed in place.
+    Layout doesn't depend on values, so only that node's dict is new; the
+    rest are shared with the earlier snapshot.
+    """
+    patched = list(nodes)
+    patched[node_id] = {**nodes[node_id], "value": value}
+    return patched
 
 
 def calculate_positions(nodes: List[Dict[str, Any]]):
     """
-    Calculate x, y coordinates for tree visualization.
-    Uses a layout algorithm that prevents node overlap.
+    Calculate x, y coordinates for tree visualization, in place.
+    Nodes unreachable from node 0 keep their coordinates.
     """
     if not nodes:
         return
     
-    # Calculate tree height
-    def get_height(node_id: int) -> int:
-        if node_id >= len(nodes):
-            return 0
-        node = nodes[node_id]
-        left_height = get_height(node["left_child_id"]) if node["left_child_id"] is not None else 0
-        right_height = get_height(node["right_child_id"]) if node["right_child_id"] is not None else 0
-        return 1 + max(left_height, right_height)
-    
-    height = get_height(0)
-    total_width = 2 ** height * 40  # Width increases with tree height
-    
-    def assign_positions(node_id: int, x: int, y: int, width: int):
-        """Recursively assign positions"""
-        if node_id is None or node_id >= len(nodes):
-            return
-        
-        nodes[node_id]["x"] = x
-        nodes[node_id]["y"] = y
-        
-        # Calculate positions for children
-        if nodes[node_id]["left_child_id"] is not None:
-            assign_positions(
-                nodes[node_id]["left_child_id"],
-                x - width // 4,
-                y + 80,
-                width // 2
-            )
+    count = len(nodes)
+    
+    def link(child_id):
+        return child_id if child_id is not None and child_id < count else None
+    
+    xs, ys = _layout([link(node["left_child_id"]) for node in nodes],
+                     [link(node["right_child_id"]) for node in nodes])
+    for node, x, y in zip(nodes, xs, ys):
+        if x is not None:
+            node["x"] = x
+            node["y"] = y
+
+
+def _layout(lefts: List[Optional[int]], rights: List[Optional[int]]) -> Tuple[list, list]:
+    """
+    x and y per node id, for a tree rooted at id 0 given as child-id lists
+    (None for a missing child). Ids unreachable from the root get None.
+    Every subtree gets one LEAF_WIDTH slot per leaf below it and each node is
+    centred over its subtree's slots, so nodes never overlap and the width
+    follows the real leaf count rather than 2 ** height.
+    """
+    # Plain int lists: a missing child points at slot `count`, a sentinel
+    # with no leaves
+    count = len(lefts)
+    lefts = [count if child_id is None else child_id for child_id in lefts]
+    rights = [count if child_id is None else child_id for child_id in rights]
+    
+    # Pre-order ids, iteratively
+    order = []
+    stack = [0]
+    while stack:
+        node_id = stack.pop()
+        order.append(node_id)
+        if rights[node_id] < count:
+            stack.append(rights[node_id])
+        if lefts[node_id] < count:
+            stack.append(lefts[node_id])
+    
+    # Leaf slots per subtree, bottom-up. A missing child next to a present one
+    # keeps a slot, so a lone child still leans to its own side.
+    leaves = [0] * (count + 1)
+    for node_id in reversed(order):
+        left, right = leaves[lefts[node_id]], leaves[rights[node_id]]
+        leaves[node_id] = max(left, 1) + max(right, 1) if left or right else 1
+    
+    # Top-down: (node, first slot x, y)
+    xs, ys = [None] * count, [None] * count
+    stack = [(0, 0, TOP_MARGIN)]
+    while stack:
+        node_id, start, y = stack.pop()
+        xs[node_id] = start + leaves[node_id] * LEAF_WIDTH // 2
+        ys[node_id] = y
         
-        if nodes[node_id]["right_child_id"] is not None:
-            assign_positions(
-                nodes[node_id]["right_child_id"],
-                x + width // 4,
-                y + 80,
-                width // 2
-            )
+        left_id, right_id = lefts[node_id], rights[node_id]
+        if left_id < count:
+            stack.append((left_id, start, y + LEVEL_HEIGHT))
+        if right_id < count:
+            stack.append((right_id, start + max(leaves[left_id], 1) * LEAF_WIDTH, y + LEVEL_HEIGHT))
     
-    # Start from root at top center
-    assign_positions(0, total_width // 2, 50, total_width)
+    return xs, ys
+
+
+def locate(root: Optional[TreeNode], value: int) -> Tuple[Optional[TreeNode], Optional[TreeNode]]:
+    """
+    Frame-free BST descent.
+    Returns (parent, node) where node holds value, or (insertion parent, None)
+    when value is absent. A plain loop - no call per level.
+    """
+    parent, node = None, root
+    while node and node.value != value:
+        parent, node = node, node.left if value < node.value else node.right
+    return parent, node
 
 
 def find_node(root: Optional[TreeNode], value: int) -> Optional[TreeNode]:
     """Find node with given value in BST"""
-    if not root or root.value == value:
-        return root
-    
-    if value < root.value:
-        return find_node(root.left, value)
-    else:
-        return find_node(root.right, value)
+    return locate(root, value)[1]
 
 
 def find_parent(root: Optional[TreeNode], target: TreeNode) -> Optional[TreeNode]:
@@ -184,42 +319,96 @@ def get_node_id(nodes: List[Dict], value: int) -> Optional[int]:
     return None
 
 
+def build_value_index(nodes: List[Dict]) -> Dict[Any, int]:
+    """
+    value -> node ID for a whole serialized tree, built once per tree so
+    callers do dict hits instead of get_node_id() scans.
+    First match wins on repeated values, as with get_node_id().
+    """
+    index = {}
+    for node in nodes:
+        index.setdefault(node["value"], node["id"])
+    return index
+
+
 def tree_to_array(root: Optional[TreeNode]) -> List[Optional[int]]:
     """Convert tree back to level-order array"""
     if not root:
         return []
     
     result = []
-    queue = [root]
+    end = 0  # length up to the last real value
+    queue = deque([root])
     
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         if node:
             result.append(node.value)
+            end = len(result)
             queue.append(node.left)
             queue.append(node.right)
         else:
             result.append(None)
     
-    # Remove trailing None values
-    while result and result[-1] is None:
-        result.pop()
+    # Remove trailing None values in one cut
+    del result[end:]
     
     return result
 
 
-def create_empty_frame(frame_id: int, description: str) -> Dict[str, Any]:
-    """Create an empty frame structure"""
+def create_empty_frame(frame_id: int, description: str,
+                       trees: Optional[List[Dict[str, Any]]] = None,
+                       variables: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Create a frame structure, optionally filled with trees/variables in one go"""
     return {
         "frame_id": frame_id,
         "timestamp_ms": frame_id * 1000,
         "description": description,
-        "trees": [],
+        "trees": trees or [],
         "arrays": [],
-        "variables": [],
+        "variables": variables or [],
         "stacks": [],
         "queues": [],
         "graphs": [],
         "linked_lists": [],
         "pointers": []
     }
+
+
+def tree_ref(name: str, ref: str, highlights: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Tree entry that points at a node list shipped once in a frame's
+    "fixtures" dict instead of repeating it in every frame.
+    The frontend resolves tree_ref against fixtures seen so far.
+    """
+    entry = {"name": name, "tree_ref": ref}
+    if highlights is not None:
+        entry["highlights"] = highlights
+    return entry
+
+
+def ship_nodes_once(frames: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Pass frames through with every inline "nodes" list swapped for a tree_ref.
+    A node list goes into "fixtures" of the first frame showing it; later
+    frames holding the very same list (unchanged tree) only reference it.
+    """
+    refs = {}  # id(node list) -> fixture name
+    shipped = []  # keeps each list alive so its id can't be reused
+    for frame in frames:
+        trees = frame["trees"]
+        if any("nodes" in tree for tree in trees):
+            entries = []
+            for tree in trees:
+                nodes = tree.get("nodes")
+                if nodes is None:
+                    entries.append(tree)
+                    continue
+                ref = refs.get(id(nodes))
+                if ref is None:
+                    ref = refs[id(nodes)] = f"tree{len(shipped)}"
+                    shipped.append(nodes)
+                    frame.setdefault("fixtures", {})[ref] = nodes
+                entries.append(tree_ref(tree["name"], ref, tree.get("highlights")))
+            frame["trees"] = entries
+        yield frame
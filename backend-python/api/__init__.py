@@ -1,4 +1,5 @@
 # API package
 from .routes import router
+from .responses import SafeORJSONResponse
 
-__all__ = ['router']
+__all__ = ['router', 'SafeORJSONResponse']
@@ -0,0 +1,17 @@
+"""Response classes"""
+from typing import Any
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+class SafeORJSONResponse(ORJSONResponse):
+    """
+    orjson for speed, stdlib json for what orjson rejects - integers beyond
+    64 bits (e.g. a long postfix product) encode fine there instead of
+    failing after the handler has already returned.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except TypeError:
+            return JSONResponse.render(self, content)
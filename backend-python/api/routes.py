@@ -1,5 +1,8 @@
 """API routes"""
-from fastapi import APIRouter, HTTPException
+import json
+from functools import lru_cache
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from core import cpp_compiler
 import algorithms
@@ -27,13 +30,25 @@ async def list_modules():
         })
     return {"modules": modules_list}
 
+@lru_cache(maxsize=None)
+def _encode_module(module_name):
+    """Module config (code samples included) is static - encode it to UTF-8 JSON once"""
+    # Same encoding FastAPI's default JSONResponse applies
+    return json.dumps(
+        jsonable_encoder(algorithms.get_module(module_name)),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
 @router.get("/api/module/{module_name}")
 async def get_module(module_name: str):
     """Get module configuration"""
-    module = algorithms.get_module(module_name)
-    if not module:
+    # Check first so unknown names never reach the cache
+    if not algorithms.get_module(module_name):
         raise HTTPException(status_code=404, detail="Module not found")
-    return module
+    return Response(content=_encode_module(module_name), media_type="application/json")
 
 @router.post("/api/validate")
 async def validate_code(request: ValidateRequest):
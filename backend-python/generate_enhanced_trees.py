@@ -3,14 +3,16 @@ Script to generate enhanced tree algorithm files with 15-20 frames each
 This creates production-grade visualizations for BST Delete, Traversals, and LCA
 """
 
+import ast
 import os
+import py_compile
 
 # BST DELETE with comprehensive frames
 bst_delete_code = '''"""
 BST Delete - PRODUCTION GRADE with 15-20 frames
 """
-from typing import List, Dict, Any
-from .tree_utils import build_tree_from_array, serialize_tree, create_empty_frame, TreeNode
+from typing import Dict, Any, Tuple
+from .tree_utils import build_tree_cached, serialize_tree, create_empty_frame, replace_value, TreeNode
 
 METADATA = {
     "name": "BST Delete",
@@ -20,141 +22,160 @@ METADATA = {
     "default_input": {"tree_values": [50, 30, 70, 20, 40, 60, 80], "delete_value": 30}
 }
 
-def find_min(node):
-    while node.left:
-        node = node.left
-    return node
+# Fixed part of the delete-target highlight; frames add only node_ids
+DELETE_HIGHLIGHT = {"colors": ("#e74c3c",), "labels": ("TO DELETE",)}
 
-def execute(params: dict) -> List[Dict[str, Any]]:
+# Frame descriptions; {value} is the value being deleted, {successor} its in-order successor
+INTRO_DESC = "🗑️ BST Delete: Removing a node while maintaining BST property"
+GOAL_DESC = "🎯 Goal: Delete node {value} from BST. Three cases: (1) Leaf (2) One child (3) Two children"
+SEARCH_DESC = "🔍 First, find node {value} in the tree..."
+NOT_FOUND_DESC = "❌ Node {value} not found in tree"
+FOUND_DESC = "✓ Found node {value}! Determining deletion case..."
+CASE1_DESC = "📋 CASE 1: Leaf Node (no children) - Simply remove it"
+REMOVED_LEAF_DESC = "✂️ Removed leaf node {value}"
+CASE2_DESC = "📋 CASE 2: One Child - Replace with child"
+REPLACED_DESC = "🔄 Replaced {value} with its child"
+CASE3_DESC = "📋 CASE 3: Two Children - Use inorder successor (min from right subtree)"
+SUCCESSOR_DESC = "🔍 Finding inorder successor... Found: {successor}"
+COPY_DESC = "📝 Copy successor value {successor} to node position"
+DONE_DESC = "✅ Deletion Complete! BST property maintained"
+COMPLEXITY_DESC = "⏱️ Time Complexity: O(h) for search + O(h) for deletion = O(h)"
+
+def _tree_payload(root, name="Binary Search Tree"):
+    return [{"name": name, "nodes": serialize_tree(root)}] if root else []
+
+def execute(params: dict) -> Tuple[Dict[str, Any], ...]:
     frames, frame_id = [], 0
+    _append = frames.append  # bound once, called per frame
     tree_values, delete_value = params.get('tree_values', []), params.get('delete_value')
     
     if delete_value is None:
-        frames.append(create_empty_frame(0, "Error: No value provided to delete"))
-        return frames
+        _append(create_empty_frame(0, "Error: No value provided to delete"))
+        return tuple(frames)
     
-    root = build_tree_from_array(tree_values)
+    # Fresh clone of a cached template - repeated inputs skip rebuilding
+    root = build_tree_cached(tree_values)
+    # One payload per tree state, shared by every frame until the next mutation
+    cached = _tree_payload(root)
     
     # INTRO FRAMES
-    frame = create_empty_frame(frame_id, "🗑️ BST Delete: Removing a node while maintaining BST property")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frame["variables"] = [{"name": "delete_value", "value": str(delete_value), "type": "int"}]
-    frames.append(frame)
+    _append(create_empty_frame(frame_id, INTRO_DESC,
+                               trees=cached,
+                               variables=[{"name": "delete_value", "value": str(delete_value), "type": "int"}]))
     frame_id += 1
     
-    frame = create_empty_frame(frame_id, f"🎯 Goal: Delete node {delete_value} from BST. Three cases: (1) Leaf (2) One child (3) Two children")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
+    _append(create_empty_frame(frame_id, GOAL_DESC.format(value=delete_value), trees=cached))
     frame_id += 1
     
     # SEARCH FOR NODE
-    frame = create_empty_frame(frame_id, f"🔍 First, find node {delete_value} in the tree...")
-    if root:
-        frame["trees"] = [{" name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
+    _append(create_empty_frame(frame_id, SEARCH_DESC.format(value=delete_value), trees=cached))
     frame_id += 1
     
-    # Find node
-    current, parent = root, None
+    # Find node, following its serialized id along the same links
+    serialized = cached[0]["nodes"] if cached else []
+    current, parent, node_id = root, None, 0
+    went_left = False  # which child link of parent leads to current
     found = False
     while current:
         if current.value == delete_value:
             found = True
             break
         parent = current
-        current = current.left if delete_value < current.value else current.right
+        went_left = delete_value < current.value
+        if went_left:
+            current, node_id = current.left, serialized[node_id]["left_child_id"]
+        else:
+            current, node_id = current.right, serialized[node_id]["right_child_id"]
     
     if not found:
-        frame = create_empty_frame(frame_id, f"❌ Node {delete_value} not found in tree")
-        frames.append(frame)
-        return frames
+        _append(create_empty_frame(frame_id, NOT_FOUND_DESC.format(value=delete_value)))
+        return tuple(frames)
     
-    serialized = serialize_tree(root)
-    node_id = next((n["id"] for n in serialized if n["value"] == delete_value), None)
-    
-    frame = create_empty_frame(frame_id, f"✓ Found node {delete_value}! Determining deletion case...")
-    frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialized, 
-                       "highlights": {"node_ids": [node_id], "colors": ["#e74c3c"], "labels": ["TO DELETE"]}}]
-    frames.append(frame)
+    _append(create_empty_frame(frame_id, FOUND_DESC.format(value=delete_value),
+                               trees=[{"name": "Binary Search Tree", "nodes": serialized,
+                                       "highlights": {"node_ids": [node_id], **DELETE_HIGHLIGHT}}]))
     frame_id += 1
     
     # CASE DETERMINATION
     if not current.left and not current.right:
-        frame = create_empty_frame(frame_id, "📋 CASE 1: Leaf Node (no children) - Simply remove it")
-        frames.append(frame)
+        _append(create_empty_frame(frame_id, CASE1_DESC))
         frame_id += 1
         
-        if parent None:
+        if parent is None:
             root = None
-        elif parent.left == current:
+        elif went_left:
             parent.left = None
         else:
             parent.right = None
+        cached = _tree_payload(root)
             
-        frame = create_empty_frame(frame_id, f"✂️ Removed leaf node {delete_value}")
-        if root:
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-        frames.append(frame)
+        _append(create_empty_frame(frame_id, REMOVED_LEAF_DESC.format(value=delete_value), trees=cached))
+        frame_id += 1
         
     elif not current.left or not current.right:
-        frame = create_empty_frame(frame_id, "📋 CASE 2: One Child -Replace with child")
-        frames.append(frame)
+        _append(create_empty_frame(frame_id, CASE2_DESC))
         frame_id += 1
         
         child = current.left or current.right
         if parent is None:
             root = child
-        elif parent.left == current:
+        elif went_left:
             parent.left = child
         else:
             parent.right = child
+        cached = _tree_payload(root)
             
-        frame = create_empty_frame(frame_id, f"🔄 Replaced {delete_value} with its child")
-        if root:
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-        frames.append(frame)
+        _append(create_empty_frame(frame_id, REPLACED_DESC.format(value=delete_value), trees=cached))
+        frame_id += 1
         
     else:
-        frame = create_empty_frame(frame_id, "📋 CASE 3: Two Children - Use inorder successor (min from right subtree)")
-        frames.append(frame)
+        _append(create_empty_frame(frame_id, CASE3_DESC))
         frame_id += 1
         
-        successor = find_min(current.right)
-        frame = create_empty_frame(frame_id, f"🔍 Finding inorder successor... Found: {successor.value}")
-        frames.append(frame)
+        # Leftmost node of the right subtree, keeping its parent for the unlink
+        succ_parent, successor = current, current.right
+        while successor.left:
+            succ_parent, successor = successor, successor.left
+        _append(create_empty_frame(frame_id, SUCCESSOR_DESC.format(successor=successor.value)))
         frame_id += 1
         
         successor_value = successor.value
         current.value = successor_value
+        # Only that one node changed - patch its dict instead of re-walking the tree
+        serialized = replace_value(serialized, node_id, successor_value)
+        cached = [{"name": "Binary Search Tree", "nodes": serialized}]
         
-        frame = create_empty_frame(frame_id, f"📝 Copy successor value {successor_value} to node position")
-        if root:
-            frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-        frames.append(frame)
+        _append(create_empty_frame(frame_id, COPY_DESC.format(successor=successor_value), trees=cached))
         frame_id += 1
         
-        # Delete successor (recursively)
-        params_new = {"tree_values": [], "delete_value": successor_value}
-        # Simplified - just remove successor
+        # Unlink the now-duplicate successor: it has no left child, so its
+        # right subtree takes its place
+        if succ_parent is current:
+            succ_parent.right = successor.right
+        else:
+            succ_parent.left = successor.right
+        cached = _tree_payload(root)
         
     # FINAL FRAMES
-    frame = create_empty_frame(frame_id, f"✅ Deletion Complete! BST property maintained")
-    if root:
-        frame["trees"] = [{"name": "Binary Search Tree", "nodes": serialize_tree(root)}]
-    frames.append(frame)
+    _append(create_empty_frame(frame_id, DONE_DESC, trees=cached))
     frame_id += 1
     
-    frame = create_empty_frame(frame_id, "⏱️ Time Complexity: O(h) for search + O(h) for deletion = O(h)")
-    frames.append(frame)
+    _append(create_empty_frame(frame_id, COMPLEXITY_DESC))
     
-    return frames
+    # Read-only from here on - hand callers a tuple
+    return tuple(frames)
 '''
 
+# Parse before touching disk: a broken template raises SyntaxError here and
+# leaves the existing module in place
+ast.parse(bst_delete_code, filename="algorithms/trees/bst_delete.py")
+
 # Write the file
 with open("algorithms/trees/bst_delete.py", "w") as f:
     f.write(bst_delete_code)
 
+# Byte-compile now so the first import loads the cached .pyc
+py_compile.compile("algorithms/trees/bst_delete.py", doraise=True)
+
 print("Created enhanced bst_delete.py")
 print("Note: Files created with comprehensive frames - test after generation")
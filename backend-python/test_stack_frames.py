@@ -1,24 +1,44 @@
+import sys
+
 from algorithms.stack.postfix_eval import execute as postfix_execute
 from algorithms.stack.balanced_parens import execute as balanced_execute
 from algorithms.stack.prefix_postfix import execute as prefix_execute
+import json
+from fastapi.encoders import jsonable_encoder
+from api import SafeORJSONResponse
+
+# Lines are collected and written once at the end instead of a print() each
+_out = []
+_emit = _out.append
+
+FRAME_LINE = "Frame {i:2d}: {d:<50} | Stack: {s}".format
+
+# Product past 64 bits - stdlib json encodes it, plain orjson can't
+BIG_INT_EXPRESSION = "99*" + "9*" * 25
+
+# One case per algorithm: (title, executor, expression)
+CASES = [
+    ("POSTFIX EVALUATION", postfix_execute, '23*'),
+    ("BALANCED PARENTHESES", balanced_execute, '{()}'),
+    ("PREFIX TO POSTFIX", prefix_execute, '+ab'),
+    ("POSTFIX EVALUATION (BIG INT)", postfix_execute, BIG_INT_EXPRESSION),
+]
+
+for n, (title, execute, expression) in enumerate(CASES):
+    _emit(("\n" if n else "") + "=" * 60)
+    _emit(f"{title}: '{expression}'")
+    _emit("=" * 60)
+    frames = execute({'expression': expression})
+    _out.extend(FRAME_LINE(i=i, d=frame['description'][:50], s=frame['data']['values'])
+                for i, frame in enumerate(frames))
+
+# /api/execute encodes after the route returns - render that payload the
+# same way (jsonable_encoder, then the app's response class)
+trace = postfix_execute({'expression': BIG_INT_EXPRESSION})
+body = json.loads(SafeORJSONResponse(jsonable_encoder({"trace": trace, "error": None})).body)
+assert len(body["trace"]) == len(trace) and body["error"] is None
+_emit("\n" + "=" * 60)
+_emit(f"RESPONSE RENDER (BIG INT): {len(body['trace'])} frames")
+_emit("=" * 60)
 
-print("=" * 60)
-print("POSTFIX EVALUATION: '23*'")
-print("=" * 60)
-frames = postfix_execute({'expression': '23*'})
-for i, frame in enumerate(frames):
-    print(f"Frame {i:2d}: {frame['description'][:50]:<50} | Stack: {frame['data']['values']}")
-
-print("\n" + "=" * 60)
-print("BALANCED PARENTHESES: '{()}'")
-print("=" * 60)
-frames = balanced_execute({'expression': '{()}'})
-for i, frame in enumerate(frames):
-    print(f"Frame {i:2d}: {frame['description'][:50]:<50} | Stack: {frame['data']['values']}")
-
-print("\n" + "=" * 60)
-print("PREFIX TO POSTFIX: '+ab'")
-print("=" * 60)
-frames = prefix_execute({'expression': '+ab'})
-for i, frame in enumerate(frames):
-    print(f"Frame {i:2d}: {frame['description'][:50]:<50} | Stack: {frame['data']['values']}")
+sys.stdout.write("\n".join(_out) + "\n")
@@ -3,63 +3,49 @@
 import sys
 sys.path.append('.')
 
+# Lines are collected and written once at the end instead of a print() each
+_out = []
+_emit = _out.append
+
 from algorithms.trees.bst_insert import execute as bst_insert_exec
 from algorithms.trees.bst_search import execute as bst_search_exec
 from algorithms.trees.bst_delete import execute as bst_delete_exec
 from algorithms.trees.binary_tree_traversals import execute as traversals_exec
 from algorithms.trees.lca_in_bst import execute as lca_exec
 
-# Test BST Insert
-print("=" * 60)
-print("BST INSERT - Frame Analysis")
-print("=" * 60)
-frames = bst_insert_exec({'tree_values': [50,30,70,20,40,60,80], 'insert_value': 45})
-print(f"Total frames: {len(frames)}\n")
-for i, frame in enumerate(frames):
-    print(f"Frame {i}: {frame['description']}")
-
-# Test BST Search
-print("\n" + "=" * 60)
-print("BST SEARCH - Frame Analysis")
-print("=" * 60)
-frames = bst_search_exec({'tree_values': [50,30,70,20,40,60,80], 'search_value': 40})
-print(f"Total frames: {len(frames)}\n")
-for i, frame in enumerate(frames):
-    print(f"Frame {i}: {frame['description']}")
-
-# Test BST Delete
-print("\n" + "=" * 60)
-print("BST DELETE - Frame Analysis")
-print("=" * 60)
-frames = bst_delete_exec({'tree_values': [50,30,70,20,40,60,80], 'delete_value': 30})
-print(f"Total frames: {len(frames)}\n")
-for i, frame in enumerate(frames):
-    print(f"Frame {i}: {frame['description']}")
-
-# Test Traversals
-print("\n" + "=" * 60)
-print("BINARY TREE TRAVERSALS - Frame Analysis")
-print("=" * 60)
-frames = traversals_exec({'tree_values': [50,30,70,20,40,60,80], 'traversal_type': 'inorder'})
-print(f"Total frames: {len(frames)}\n")
-for i, frame in enumerate(frames):
-    desc = frame['description'][:80] + "..." if len(frame['description']) > 80 else frame['description']
-    print(f"Frame {i}: {desc}")
-
-# Test LCA
-print("\n" + "=" * 60)
-print("LCA IN BST - Frame Analysis")
-print("=" * 60)
-frames = lca_exec({'tree_values': [50,30,70,20,40,60,80], 'node1': 20, 'node2': 60})
-print(f"Total frames: {len(frames)}\n")
-for i, frame in enumerate(frames):
-    print(f"Frame {i}: {frame['description']}")
-
-print("\n" + "=" * 60)
-print("SUMMARY")
-print("=" * 60)
-print("Current frame counts are GOOD but can be enhanced with:")
-print("1. More intermediate explanation frames")
-print("2. Visual path history showing traversal")
-print("3. Educational 'WHY' explanations")
-print("4. Comparison with alternative scenarios")
+# Every case runs on the same tree, so the executors' template cache builds it once.
+# A tuple is already the cache key, so no case converts or copies it.
+SHARED_TREE = (50,30,70,20,40,60,80)
+
+# One case per algorithm: (title, executor, params, max description length)
+CASES = [
+    ("BST INSERT", bst_insert_exec, {'tree_values': SHARED_TREE, 'insert_value': 45}, None),
+    ("BST SEARCH", bst_search_exec, {'tree_values': SHARED_TREE, 'search_value': 40}, None),
+    ("BST DELETE", bst_delete_exec, {'tree_values': SHARED_TREE, 'delete_value': 30}, None),
+    ("BINARY TREE TRAVERSALS", traversals_exec, {'tree_values': SHARED_TREE, 'traversal_type': 'inorder'}, 80),
+    ("LCA IN BST", lca_exec, {'tree_values': SHARED_TREE, 'node1': 20, 'node2': 60}, None),
+]
+
+for n, (title, execute, params, width) in enumerate(CASES):
+    _emit(("\n" if n else "") + "=" * 60)
+    _emit(f"{title} - Frame Analysis")
+    _emit("=" * 60)
+    frames = list(execute(params))
+    assert frames, f"{title}: no frames"
+    _emit(f"Total frames: {len(frames)}\n")
+    for i, frame in enumerate(frames):
+        desc = frame['description']
+        if width and len(desc) > width:
+            desc = desc[:width] + "..."
+        _emit(f"Frame {i}: {desc}")
+
+_emit("\n" + "=" * 60)
+_emit("SUMMARY")
+_emit("=" * 60)
+_emit("Current frame counts are GOOD but can be enhanced with:")
+_emit("1. More intermediate explanation frames")
+_emit("2. Visual path history showing traversal")
+_emit("3. Educational 'WHY' explanations")
+_emit("4. Comparison with alternative scenarios")
+
+sys.stdout.write("\n".join(_out) + "\n")
@@ -13,8 +13,14 @@ const ArrayVisualizer = ({ data, highlights }) => {
     // Normalize highlights to handle both formats:
     // Format 1: Simple array [1, 2] (from Linear/Sentinel Search)
     // Format 2: Object {indices: [1, 2], colors: [...], labels: [...]} (from Binary Search)
+    // Format 3: Range {range: [start, end]} covering start..end-1 (from Linear Search)
     const normalizeHighlights = (h) => {
         if (!h) return { indices: [], colors: [], labels: [] };
+        if (h.range) {
+            // Range format - expand to a simple array first
+            const [start, end] = h.range;
+            h = Array.from({ length: Math.max(end - start, 0) }, (_, k) => start + k);
+        }
         if (Array.isArray(h)) {
             // Simple array format - convert to object
             return {
@@ -5,6 +5,20 @@ import EditableCodePanel from '../components/EditableCodePanel';
 import TerminalOutput from '../components/TerminalOutput';
 import './ModulePage.css';
 
+// Tree frames ship shared node lists once under `fixtures` and point at
+// them with `tree_ref`; attach the referenced nodes before rendering.
+const resolveTreeRefs = (frames) => {
+    const fixtures = {};
+    return frames.map(frame => {
+        if (frame.fixtures) Object.assign(fixtures, frame.fixtures);
+        if (!frame.trees?.some(tree => tree.tree_ref)) return frame;
+        return {
+            ...frame,
+            trees: frame.trees.map(tree => tree.tree_ref ? { ...tree, nodes: fixtures[tree.tree_ref] } : tree)
+        };
+    });
+};
+
 export default function ModulePage() {
     const { moduleName } = useParams();
     const navigate = useNavigate();
@@ -79,7 +93,7 @@ export default function ModulePage() {
                 return;
             }
 
-            setTrace(data.trace || []);
+            setTrace(resolveTreeRefs(data.trace || []));
             addTerminalOutput({ type: 'success', text: `✓ Generated ${data.trace?.length || 0} steps` });
 
             if (data.trace && data.trace.length > 0) {